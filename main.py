@@ -58,7 +58,7 @@ def main():
     
     # If no file provided, get input from console
     print("Enter Greek text (enter three empty lines in a row to finish):")
-    text = ""
+    lines = []
     empty_lines = 0
     
     try:
@@ -70,10 +70,12 @@ def main():
                 empty_lines = 0
             
             if empty_lines < 3:  # Only add lines that aren't part of the exit sequence
-                text += line + "\n"
+                lines.append(line + "\n")
     except EOFError:
         # Handle case where input is from a pipe/file
         pass
+    # Join once at the end rather than growing a string per line
+    text = "".join(lines)
     
     if not text.strip():
         print("No text entered. Exiting.")
@@ -1,4 +1,5 @@
 from .morph_entry import MorphEntry
 from .morph_parser import MorphParser
+from .parse_result import ParseResult
 
-__all__ = ['MorphEntry', 'MorphParser'] 
\ No newline at end of file
+__all__ = ['MorphEntry', 'MorphParser', 'ParseResult'] 
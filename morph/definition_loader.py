@@ -1,7 +1,16 @@
+import hashlib
 import os
+import pickle
 import beta_code
 import re
 from typing import Dict, Optional
+from .normalize import beta_code_to_greek
+
+# Where parsed data is cached between runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "greek-vocab-tool")
+
+# Bump when the structure of the loaded definitions changes, to ignore older cache files
+_CACHE_VERSION = 1
 
 class DefinitionLoader:
     def __init__(self, definitions_path: str = None):
@@ -14,17 +23,57 @@ class DefinitionLoader:
         self._definitions: Dict[str, str] = {}
         self._load_definitions()
     
+    def _cache_path(self) -> str:
+        """Path of the pickled definitions cache for this definitions file."""
+        path_hash = hashlib.sha1(os.path.abspath(self.definitions_path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(CACHE_DIR, f"shortdefs-{path_hash}.pkl")
+
     def _load_definitions(self):
-        """Load definitions from the file into memory."""
+        """Load definitions into memory, from the pickled cache if it is newer than the file."""
         if not os.path.exists(self.definitions_path):
             raise FileNotFoundError(f"Definitions file not found at {self.definitions_path}")
-            
+        
+        cache_path = self._cache_path()
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(self.definitions_path):
+                with open(cache_path, 'rb') as f:
+                    version, definitions = pickle.load(f)
+                if version == _CACHE_VERSION:
+                    self._definitions = definitions
+                    return
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+            # Missing or unreadable cache (including one pickled from other code); parse the file instead
+            pass
+        
+        self._parse_definitions()
+        
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so a concurrent reader never sees a partial pickle
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    pickle.dump((_CACHE_VERSION, self._definitions), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                # Don't leave a partial pickle behind
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        except (OSError, pickle.PicklingError):
+            # Caching is only an optimization
+            pass
+    
+    def _parse_definitions(self):
+        """Parse the tab-separated definitions file."""
         with open(self.definitions_path, 'r', encoding='utf-8') as f:
             for line in f:
                 if line.strip():
                     greek, definition = line.strip().split('\t')
                     # Store both beta code and Unicode versions for flexible lookup
-                    unicode_greek = beta_code.beta_code_to_greek(greek)
+                    unicode_greek = beta_code_to_greek(greek)
                     beta_code_greek = beta_code.greek_to_beta_code(greek)
                     
                     # Store both the exact form and the base form (without numbers)
@@ -33,7 +82,7 @@ class DefinitionLoader:
                     
                     base_greek = re.sub(r'\d+$', '', greek)
                     if base_greek != greek:
-                        unicode_base = beta_code.beta_code_to_greek(base_greek)
+                        unicode_base = beta_code_to_greek(base_greek)
                         beta_code_base = beta_code.greek_to_beta_code(base_greek)
                         self._definitions[unicode_base] = definition
                         self._definitions[beta_code_base] = definition
@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from typing import List, Set
+from typing import FrozenSet, List
 
 class UnknownFeatureError(ValueError):
     """Raised when an unknown morphological feature is encountered."""
@@ -140,38 +140,27 @@ class Feature(Enum):
         Raises:
             UnknownFeatureError: If the feature is not recognized
         """
+        # Every spelling morpheus uses (imperf, indecl, aor1, ...) is its own member value,
+        # so this is a single lookup in the enum's value map
         try:
-            # Handle special cases
-            if feature == "imperf":
-                return cls.IMPERFECT_ALT
-            if feature == "indecl":
-                return cls.INDECLINABLE_ALT
-            if feature == "imperat":
-                return cls.IMPERATIVE_ALT
-            if feature == "imperat alt":
-                return cls.IMPERATIVE_ALT2
-            if feature == "aor1":
-                return cls.AORIST1
-            if feature == "aor2":
-                return cls.AORIST2
-            return next(f for f in cls if f.value == feature)
-        except StopIteration:
+            return cls(feature)
+        except ValueError:
             raise UnknownFeatureError(feature)
     
     @classmethod
-    def from_list(cls, features: List[str]) -> Set['Feature']:
-        """Convert a list of morpheus feature strings to a set of enum values.
+    def from_list(cls, features: List[str]) -> FrozenSet['Feature']:
+        """Convert a list of morpheus feature strings to a frozenset of enum values.
         
         Args:
             features: List of feature strings from morpheus
             
         Returns:
-            Set of corresponding Feature enum values
+            Frozenset of corresponding Feature enum values
             
         Raises:
             UnknownFeatureError: If any feature is not recognized
         """
-        return {cls.from_str(f) for f in features}
+        return frozenset(cls.from_str(f) for f in features)
     
     def __str__(self) -> str:
         """Return a human-readable string representation."""
@@ -1,5 +1,10 @@
+import re
 from enum import Enum, auto
-from typing import Optional, Set
+from functools import lru_cache
+from typing import AbstractSet, FrozenSet, Optional
+
+# Morpheus separates multiple classes with commas, spaces, or both
+_CLASS_SEPARATOR = re.compile(r"[,\s]+")
 
 class UnknownMorphClassError(ValueError):
     """Raised when an unknown morphological class is encountered."""
@@ -254,84 +259,88 @@ class MorphClass(Enum):
     GEOG_NAME = "geog_name"          # Geographical names and place names
     
     @classmethod
-    def get_adjective_classes(cls) -> Set['MorphClass']:
+    def get_adjective_classes(cls) -> FrozenSet['MorphClass']:
         """Returns the set of morphological classes that indicate an adjective."""
-        return {
-            cls.ADJ_2_1_2,       # os_h_on like ἀγαθός, -ή, -όν
-            cls.ADJ_2_2,         # os_on like βάρβαρος, -ον
-            cls.ADJ_3_3,         # hs_es like ἀληθής, -ές
-            cls.WN_ON,           # wn_on like σώφρων, σῶφρον
-            cls.US_EIA_U,        # us_eia_u like γλυκύς, γλυκεῖα, γλυκύ
-            cls.IRREG_ADJ3,      # Irregular adjectives of third declension
-            cls.WN_ON_COMP,      # Comparative adjectives like μείζων, μεῖζον
-            cls.IRREG_COMP,      # Irregular comparative forms
-            cls.IRREG_SUPERL,    # Irregular superlative forms
-            cls.AS_ASA_AN,       # Adjectives/participles with -ας, -ασα, -αν endings
-            cls.AS_AINA_AN,      # Three-termination adjectives like τάλας, τάλαινα, τάλαν
-            cls.EIS_ESSA,        # Three-termination adjectives with -εις, -εσσα, -εν endings
-            cls.EOS_EH_EON,      # Three-termination adjectives with -εος/-εη/-εον pattern
-            cls.HEIS_HESSA,      # Irregular adjectives like εἷς, μία, ἕν
-            cls.HN_EINA_EN,      # Three-termination adjectives with -ην/-εινα/-εν pattern
-            cls.IS_IDOS_ADJ,     # Adjectives with -ις/-ιδος pattern
-            cls.IS_ITOS_ADJ,     # Adjectives with -ις/-ιτος pattern
-            cls.N_NOS_ADJ,       # Adjectives with -ν/-νος pattern
-            cls.OEIS_OESSA,      # Three-termination adjectives with -οεις/-οεσσα/-οεν pattern
-            cls.OOS_OH_OON,      # Three-termination adjectives with -οος/-οη/-οον pattern
-            cls.OOS_OON,         # Two-termination adjectives with -οος/-οον pattern
-            cls.VERB_ADJ,        # Verbal adjectives (general pattern)
-            cls.VERB_ADJ1,       # Verbal adjectives pattern 1
-            cls.VERB_ADJ2,       # Verbal adjectives pattern 2
-            cls.WN_OUSA_ON,      # Participles with -ων/-ουσα/-ον pattern
-            cls.ARTICLE_ADJECTIVE  # For words like ἄλλος, αὐτός that can function as adjectives
-        }
+        return _ADJECTIVE_CLASSES
     
     @classmethod
-    def from_str(cls, morph_class: str) -> Set['MorphClass']:
-        """Convert a morpheus class string to a set of enum values.
+    def from_str(cls, morph_class: str) -> FrozenSet['MorphClass']:
+        """Convert a morpheus class string to a frozenset of enum values.
         
         Args:
             morph_class: The class string from morpheus (may be comma-separated)
             
         Returns:
-            Set of corresponding MorphClass enum values
+            Frozenset of corresponding MorphClass enum values
             
         Raises:
             UnknownMorphClassError: If any class is not recognized
         """
         if not morph_class:
-            return set()
-            
-        # Handle comma-separated classes
-        if "," in morph_class:
-            classes = set()
-            for c in morph_class.split(","):
-                classes.update(cls.from_str(c.strip()))
-            return classes
+            return frozenset()
             
-        # Handle space-separated classes
-        if " " in morph_class:
-            classes = set()
-            for c in morph_class.split():
-                classes.update(cls.from_str(c.strip()))
-            return classes
-            
-        try:
-            return {next(c for c in cls if c.value == morph_class)}
-        except StopIteration:
-            raise UnknownMorphClassError(morph_class)
+        classes = set()
+        for code in _CLASS_SEPARATOR.split(morph_class.strip()):
+            if not code:
+                continue
+            try:
+                classes.add(cls(code))
+            except ValueError:
+                raise UnknownMorphClassError(code)
+        return frozenset(classes)
     
     def __str__(self) -> str:
         """Return a human-readable string representation."""
         return self.name.lower().replace('_', ' ')
 
     @classmethod
-    def is_adjective(cls, morph_classes: Set['MorphClass']) -> bool:
+    def is_adjective(cls, morph_classes: AbstractSet['MorphClass']) -> bool:
         """Check if any of the given morphological classes indicate an adjective.
         
+        Answers are memoized per combination of classes. MorphEntry already stores its
+        classes as shared frozensets, which frozenset() returns without copying.
+        
         Args:
             morph_classes: Set of morphological classes to check
             
         Returns:
             True if any of the morphological classes indicate an adjective, False otherwise
         """
-        return bool(morph_classes.intersection(cls.get_adjective_classes())) 
\ No newline at end of file
+        return _is_adjective(frozenset(morph_classes))
+
+
+# Morphological classes that indicate an adjective; built once, since an Enum class body
+# can't hold a frozenset attribute without making it a member
+_ADJECTIVE_CLASSES: FrozenSet[MorphClass] = frozenset({
+    MorphClass.ADJ_2_1_2,         # os_h_on like ἀγαθός, -ή, -όν
+    MorphClass.ADJ_2_2,           # os_on like βάρβαρος, -ον
+    MorphClass.ADJ_3_3,           # hs_es like ἀληθής, -ές
+    MorphClass.WN_ON,             # wn_on like σώφρων, σῶφρον
+    MorphClass.US_EIA_U,          # us_eia_u like γλυκύς, γλυκεῖα, γλυκύ
+    MorphClass.IRREG_ADJ3,        # Irregular adjectives of third declension
+    MorphClass.WN_ON_COMP,        # Comparative adjectives like μείζων, μεῖζον
+    MorphClass.IRREG_COMP,        # Irregular comparative forms
+    MorphClass.IRREG_SUPERL,      # Irregular superlative forms
+    MorphClass.AS_ASA_AN,         # Adjectives/participles with -ας, -ασα, -αν endings
+    MorphClass.AS_AINA_AN,        # Three-termination adjectives like τάλας, τάλαινα, τάλαν
+    MorphClass.EIS_ESSA,          # Three-termination adjectives with -εις, -εσσα, -εν endings
+    MorphClass.EOS_EH_EON,        # Three-termination adjectives with -εος/-εη/-εον pattern
+    MorphClass.HEIS_HESSA,        # Irregular adjectives like εἷς, μία, ἕν
+    MorphClass.HN_EINA_EN,        # Three-termination adjectives with -ην/-εινα/-εν pattern
+    MorphClass.IS_IDOS_ADJ,       # Adjectives with -ις/-ιδος pattern
+    MorphClass.IS_ITOS_ADJ,       # Adjectives with -ις/-ιτος pattern
+    MorphClass.N_NOS_ADJ,         # Adjectives with -ν/-νος pattern
+    MorphClass.OEIS_OESSA,        # Three-termination adjectives with -οεις/-οεσσα/-οεν pattern
+    MorphClass.OOS_OH_OON,        # Three-termination adjectives with -οος/-οη/-οον pattern
+    MorphClass.OOS_OON,           # Two-termination adjectives with -οος/-οον pattern
+    MorphClass.VERB_ADJ,          # Verbal adjectives (general pattern)
+    MorphClass.VERB_ADJ1,         # Verbal adjectives pattern 1
+    MorphClass.VERB_ADJ2,         # Verbal adjectives pattern 2
+    MorphClass.WN_OUSA_ON,        # Participles with -ων/-ουσα/-ον pattern
+    MorphClass.ARTICLE_ADJECTIVE  # For words like ἄλλος, αὐτός that can function as adjectives
+})
+
+
+@lru_cache(maxsize=512)
+def _is_adjective(morph_classes: FrozenSet[MorphClass]) -> bool:
+    return not morph_classes.isdisjoint(_ADJECTIVE_CLASSES) 
\ No newline at end of file
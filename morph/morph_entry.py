@@ -1,15 +1,35 @@
+import sys
 from dataclasses import dataclass
-from typing import Set, Optional
+from typing import Dict, FrozenSet, Optional
 from .part_of_speech import PartOfSpeech
 from .features import Feature
 from .morph_class import MorphClass
 
-@dataclass
+# One shared frozenset per distinct feature or morph class combination; a text has
+# thousands of entries but only a few hundred combinations between them
+_FROZENSET_POOL: Dict[frozenset, frozenset] = {}
+
+def _intern(values) -> frozenset:
+    values = frozenset(values)
+    return _FROZENSET_POOL.setdefault(values, values)
+
+@dataclass(frozen=True, slots=True)
 class MorphEntry:
-    """A single morphological analysis result."""
+    """A single morphological analysis result.
+
+    Immutable and slotted, since a long text keeps many thousands of these alive at once;
+    use dataclasses.replace to get a changed copy. Features and morph classes may be passed
+    as any iterable and are stored as shared frozensets, and lemmas are interned, so the
+    entries for one word share a single lemma string.
+    """
     original: str
     part_of_speech: PartOfSpeech
     lemma: str
-    features: Set[Feature]
-    morph_classes: Set[MorphClass]
+    features: FrozenSet[Feature]
+    morph_classes: FrozenSet[MorphClass]
     short_definition: Optional[str] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'lemma', sys.intern(self.lemma))
+        object.__setattr__(self, 'features', _intern(self.features))
+        object.__setattr__(self, 'morph_classes', _intern(self.morph_classes))
@@ -1,13 +1,54 @@
+import atexit
+import fcntl
+import hashlib
 import os
+import shelve
 import subprocess
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import beta_code
-from typing import List, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from .morph_entry import MorphEntry
 from .part_of_speech import PartOfSpeech, UnknownPartOfSpeechError
 from .features import Feature, UnknownFeatureError
 from .morph_class import MorphClass, UnknownMorphClassError
-from .definition_loader import DefinitionLoader
+from .definition_loader import CACHE_DIR, DefinitionLoader
+from .parse_result import ParseResult
+from .normalize import beta_code_to_greek, to_nfc
+
+# Apostrophe characters that might appear in Unicode text
+_APOSTROPHES = ("'", "ʼ", "'", "᾽", "᾿", "ʻ", "`")
+
+# Characters whose presence means a word is already in Beta Code
+_BETA_CODE_MARKERS = frozenset("/*\\()=|<>_^")
+
+# Characters whose presence means morpheus was given Beta Code input
+_BETA_CODE_INPUT_MARKERS = frozenset("/*\\()=|")
+
+# Batches of at least twice this many words are split across concurrent cruncher processes
+_MIN_SHARD_SIZE = 64
+_MAX_CRUNCHER_PROCESSES = 4
+
+# Most words the in-memory parse cache keeps; the oldest are dropped first
+_MAX_CACHED_WORDS = 100_000
+
+# Setting this environment variable to 1 keeps raw cruncher output on disk between runs
+DISK_CACHE_ENV_VAR = "GVT_MORPH_CACHE"
+DISK_CACHE_PATH = os.path.join(CACHE_DIR, "morph.db")
+# Part of every disk cache key; bump it when the format of the stored output changes
+_DISK_CACHE_VERSION = 2
+# Set by pytest-xdist in each worker process; each worker gets its own disk cache file,
+# since a shelve cannot safely be shared between processes
+_XDIST_WORKER_ENV_VAR = "PYTEST_XDIST_WORKER"
+
+# Disk caches this process has open, with their locks, keyed by path; parsers in one process
+# share a file rather than each opening (and locking) it. None marks a file another process holds.
+_open_disk_caches: Dict[str, Tuple[Optional[shelve.Shelf], threading.Lock]] = {}
+
+# Shared by every word with no entries (no special entries, or nothing morpheus recognized),
+# so misses don't each keep their own empty list alive in the cache
+_NO_ENTRIES: Tuple[MorphEntry, ...] = ()
 
 class MorphParser:
     def __init__(self, cruncher_path: str, stemlib_path: str, debug=False):
@@ -16,6 +57,72 @@ class MorphParser:
         self.env["MORPHLIB"] = stemlib_path
         self.definition_loader = DefinitionLoader()
         self.debug = debug
+        # Parsed entries keyed by (word, ignore_case, ignore_accent); morpheus output is
+        # deterministic, so repeated words never need another cruncher run. Bounded by
+        # _MAX_CACHED_WORDS so a book-length text can't grow it without limit.
+        self._cache: Dict[Tuple[str, bool, bool], Sequence[MorphEntry]] = {}
+        # Serializes eviction and insertion in _remember between threads sharing this parser
+        self._cache_lock = threading.Lock()
+        self._disk_cache = None
+        # Serializes disk cache access between threads only; other processes are kept off
+        # the file by the lock _open_disk_cache takes
+        self._disk_cache_lock = threading.Lock()
+        if os.environ.get(DISK_CACHE_ENV_VAR) == "1":
+            self._open_disk_cache(stemlib_path)
+
+    def _open_disk_cache(self, stemlib_path: str):
+        """Open the on-disk cache of raw cruncher output.
+        
+        Keys start with a fingerprint of the cruncher binary, stemlib path and cache format
+        version, so a rebuilt cruncher, a different stemlib or an older format is never read. Each pytest-xdist worker
+        opens its own file, and a process holds an exclusive lock on its file while it is
+        open; if another process already holds it, the disk cache is left off rather than shared.
+        """
+        try:
+            with open(self.cruncher_path, "rb") as f:
+                fingerprint = hashlib.sha1(f.read())
+        except OSError:
+            # No cruncher to fingerprint; cruncher runs will report the problem
+            return
+        fingerprint.update(f"{stemlib_path}\0{_DISK_CACHE_VERSION}".encode("utf-8"))
+        self._disk_cache_prefix = fingerprint.hexdigest()
+        
+        path = DISK_CACHE_PATH
+        worker = os.environ.get(_XDIST_WORKER_ENV_VAR)
+        if worker:
+            root, ext = os.path.splitext(DISK_CACHE_PATH)
+            path = f"{root}-{worker}{ext}"
+        if path not in _open_disk_caches:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            lock_file = open(f"{path}.lock", "w")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                print(f"Warning: {path} is in use by another process; Morpheus disk cache disabled")
+                disk_cache = None
+            else:
+                disk_cache = shelve.open(path)
+                atexit.register(lock_file.close)
+                atexit.register(disk_cache.close)
+            _open_disk_caches[path] = (disk_cache, threading.Lock())
+        self._disk_cache, self._disk_cache_lock = _open_disk_caches[path]
+
+    def _disk_cache_key(self, word: str, ignore_case: bool, ignore_accent: bool) -> str:
+        return f"{self._disk_cache_prefix}:{int(ignore_case)}{int(ignore_accent)}:{word}"
+
+    def _cached_output(self, word: str, ignore_case=False, ignore_accent=False) -> Optional[str]:
+        """Get the raw cruncher output for a Beta Code word from the disk cache, if enabled."""
+        if self._disk_cache is None:
+            return None
+        with self._disk_cache_lock:
+            return self._disk_cache.get(self._disk_cache_key(word, ignore_case, ignore_accent))
+
+    def _store_output(self, word: str, raw_output: str, ignore_case=False, ignore_accent=False):
+        """Save the raw cruncher output for a Beta Code word to the disk cache, if enabled."""
+        if self._disk_cache is not None:
+            with self._disk_cache_lock:
+                self._disk_cache[self._disk_cache_key(word, ignore_case, ignore_accent)] = raw_output
 
     def _get_attic_lemma(self, lemma: str) -> str:
         """Extract the Attic form from a lemma string.
@@ -24,8 +131,8 @@ class MorphParser:
         if ',' in lemma:
             forms = lemma.split(',')
             # Convert Beta Code lemma to Unicode
-            return beta_code.beta_code_to_greek(forms[1].strip())
-        return beta_code.beta_code_to_greek(lemma)
+            return beta_code_to_greek(forms[1].strip())
+        return beta_code_to_greek(lemma)
 
     def _determine_part_of_speech(self, code: str, features: Set[Feature], morph_classes: Set[MorphClass]) -> PartOfSpeech:
         """Determine the part of speech, handling special cases where the code alone is insufficient.
@@ -57,14 +164,14 @@ class MorphParser:
             print(f"Warning: {e} in word with features {features} and morph_classes {morph_classes}")
             raise
 
-    def _handle_special_words(self, original_word: str) -> List[MorphEntry]:
+    def _handle_special_words(self, original_word: str) -> Sequence[MorphEntry]:
         """Handle special words that Morpheus doesn't parse correctly.
         
         Args:
             original_word: The original word (in Unicode or Beta Code)
             
         Returns:
-            List of MorphEntry objects for special words, empty list if not a special word
+            MorphEntry objects for special words, empty if not a special word
         """
         # Normalize the word to check against our special cases
         word_normalized = original_word.strip()
@@ -79,14 +186,23 @@ class MorphParser:
                 original=original_word,
                 part_of_speech=PartOfSpeech.CONJUNCTION,
                 lemma=lemma,
-                features=set(),  # Conjunctions typically have no morphological features
-                morph_classes=set(),  # Conjunctions typically have no morphological classes
+                features=frozenset(),  # Conjunctions typically have no morphological features
+                morph_classes=frozenset(),  # Conjunctions typically have no morphological classes
                 short_definition=short_definition
             )]
         
-        return []
+        return _NO_ENTRIES
 
-    def parse_word(self, word: str, verbose=False, ignore_case=False, ignore_accent=False) -> List[MorphEntry]:
+    def parse_word(self, word: str, verbose=False, ignore_case=False, ignore_accent=False) -> ParseResult:
+        # Precomposed and decomposed spellings of a word are the same word to morpheus
+        word = to_nfc(word)
+        # Verbose and debug runs always go to morpheus so the debug output is printed
+        use_cache = not (verbose or self.debug)
+        key = (word, ignore_case, ignore_accent)
+        cached = self._cache.get(key) if use_cache else None
+        if cached is not None:
+            return ParseResult(cached)
+        
         # Start with normal Morpheus parsing
         morpheus_results = self._parse_with_morpheus(word, verbose, ignore_case, ignore_accent)
         
@@ -94,104 +210,294 @@ class MorphParser:
         special_entries = self._handle_special_words(word)
         
         # Combine results - special entries are added to morpheus results
-        all_results = morpheus_results + special_entries
+        all_results = ParseResult(morpheus_results)
+        all_results.extend(special_entries)
         
-        if verbose or self.debug:
-            if special_entries:
-                print(f"DEBUG: Added {len(special_entries)} special entries for '{word}'")
+        if special_entries and (verbose or self.debug):
+            print(f"DEBUG: Added {len(special_entries)} special entries for '{word}'")
         
+        if use_cache:
+            self._remember(key, all_results)
+            return ParseResult(all_results)
         return all_results
 
+    def parse_words(self, words: Iterable[str], ignore_case=False, ignore_accent=False,
+                    parallel=True, raw_outputs: Optional[Dict[str, str]] = None) -> Dict[str, ParseResult]:
+        """Parse many words with a single cruncher run (or a few concurrent ones).
+        
+        Each word gives the same entries parse_word would, but cruncher is started (and the
+        stemlib loaded) once for the whole batch, or once per shard, instead of once per word.
+        
+        Args:
+            words: The words to parse (in Unicode or Beta Code); duplicates, including
+                precomposed and decomposed spellings of the same word, are parsed once
+            ignore_case: Pass -S to cruncher to ignore case
+            ignore_accent: Pass -n to cruncher to ignore accents
+            parallel: Split large batches across several concurrent cruncher processes
+            raw_outputs: If given, filled with cruncher's raw output for each word this batch
+                sent to cruncher (or read from the disk cache), keyed as in the returned dict,
+                so failures can be diagnosed without running cruncher again
+            
+        Returns:
+            Dict mapping each word to its ParseResult
+        """
+        normalized = {word: to_nfc(word) for word in words}
+        words = list(dict.fromkeys(normalized.values()))
+        results = {}
+        if not self.debug:
+            for word in words:
+                cached = self._cache.get((word, ignore_case, ignore_accent))
+                if cached is not None:
+                    results[word] = ParseResult(cached)
+        
+        # Ensure each word is in Beta Code format for Morpheus
+        prepared = {}
+        for word in words:
+            if word in results:
+                continue
+            if _BETA_CODE_MARKERS.isdisjoint(word):
+                try:
+                    prepared[word] = self._to_beta_code(word)
+                except Exception as e:
+                    print(f"Warning: Failed to convert '{word}' to Beta Code: {e}")
+            else:
+                prepared[word] = word
+        
+        sent = list(dict.fromkeys(prepared.values()))
+        outputs = self._run_cruncher_batch(sent, ignore_case, ignore_accent, parallel) if sent else {}
+        if outputs is None:
+            # Could not tell which output belongs to which word; run cruncher once per word
+            outputs = {}
+            for beta in sent:
+                try:
+                    outputs[beta] = self._raw_output(beta, ignore_case, ignore_accent)
+                except subprocess.CalledProcessError as e:
+                    print(f"Error processing word '{beta}': {e}")
+                    print(f"stderr: {e.stderr.decode('utf-8', 'replace')}")
+                    outputs[beta] = ""
+        
+        for word in words:
+            if word in results:
+                continue
+            entries = []
+            if word in prepared:
+                beta = prepared[word]
+                # Words with initial apostrophes keep the original form, as in _parse_with_morpheus
+                original = word if word.startswith(_APOSTROPHES) else beta
+                entries = self._parse_output(original, outputs[beta])
+            entries += self._handle_special_words(word)
+            if not self.debug:
+                self._remember((word, ignore_case, ignore_accent), entries)
+            results[word] = ParseResult(entries)
+        
+        if raw_outputs is not None:
+            for word, key in normalized.items():
+                if key in prepared:
+                    raw_outputs[word] = outputs[prepared[key]]
+        return self._by_input_word(normalized, results)
+
+    def _remember(self, key: Tuple[str, bool, bool], entries: Sequence[MorphEntry]):
+        """Add parsed entries to the in-memory cache, dropping the oldest word when it is full."""
+        with self._cache_lock:
+            if len(self._cache) >= _MAX_CACHED_WORDS:
+                # Dicts keep insertion order, so the first key is the oldest
+                self._cache.pop(next(iter(self._cache), None), None)
+            self._cache[key] = entries or _NO_ENTRIES
+
+    @staticmethod
+    def _by_input_word(normalized: Dict[str, str], results: Dict[str, ParseResult]) -> Dict[str, ParseResult]:
+        """Key results by the words as given, in input order.
+        
+        Spellings that normalize to the same word each get their own copy of its entries.
+        """
+        by_input = {}
+        for word, key in normalized.items():
+            by_input[word] = results[key] if word == key else ParseResult(results[key])
+        return by_input
+
+    def _cruncher_command(self, ignore_case=False, ignore_accent=False) -> List[str]:
+        """Build the cruncher command line with the requested flags."""
+        cmd = [self.cruncher_path]
+        if ignore_case:
+            cmd.append("-S")
+        if ignore_accent:
+            cmd.append("-n")
+        return cmd
+
+    def _run_cruncher(self, cruncher_input: str, ignore_case=False, ignore_accent=False) -> str:
+        """Run cruncher on Beta Code input and return its raw output.
+        
+        The pipes are read as bytes and decoded as UTF-8 here, instead of with text=True,
+        which sets up a locale-dependent decoder on every call.
+        """
+        result = subprocess.run(
+            self._cruncher_command(ignore_case, ignore_accent),
+            input=cruncher_input.encode("utf-8"),
+            capture_output=True,
+            env=self.env,
+            check=True
+        )
+        return result.stdout.decode("utf-8", "replace")
+
+    def debug_parse(self, word: str, ignore_case=False, ignore_accent=False) -> str:
+        """Get cruncher's raw output for a word, for diagnosing words that fail to parse.
+        
+        Unicode words are converted to Beta Code first. Neither cache is consulted, so this
+        always shows what cruncher itself returns.
+        
+        Args:
+            word: The word to look up (in Unicode or Beta Code)
+            ignore_case: Pass -S to cruncher to ignore case
+            ignore_accent: Pass -n to cruncher to ignore accents
+            
+        Returns:
+            The raw cruncher output
+        """
+        if _BETA_CODE_MARKERS.isdisjoint(word):
+            word = self._to_beta_code(word)
+        return self._run_cruncher(word, ignore_case, ignore_accent)
+
+    def _run_cruncher_batch(self, words: List[str], ignore_case=False, ignore_accent=False,
+                            parallel=True) -> Optional[Dict[str, str]]:
+        """Run cruncher over several Beta Code words, one per line.
+        
+        Words found in the disk cache are not sent. With parallel, large batches are split
+        into shards run by concurrent cruncher processes. Returns None if the output cannot
+        be matched up with the input words.
+        """
+        outputs = {}
+        for word in words:
+            cached = self._cached_output(word, ignore_case, ignore_accent)
+            if cached is not None:
+                outputs[word] = cached
+        words = [word for word in words if word not in outputs]
+        if not words:
+            return outputs
+        
+        shard_count = min(os.cpu_count() or 1, _MAX_CRUNCHER_PROCESSES, len(words) // _MIN_SHARD_SIZE)
+        if not parallel or shard_count <= 1:
+            shard_outputs = [self._run_cruncher_shard(words, ignore_case, ignore_accent)]
+        else:
+            # Each shard is its own cruncher process; the threads only wait on the pipes
+            shards = [words[i::shard_count] for i in range(shard_count)]
+            with ThreadPoolExecutor(max_workers=shard_count) as executor:
+                shard_outputs = list(executor.map(
+                    lambda shard: self._run_cruncher_shard(shard, ignore_case, ignore_accent), shards))
+        
+        if any(shard_output is None for shard_output in shard_outputs):
+            return None
+        for shard_output in shard_outputs:
+            for word, raw_output in shard_output.items():
+                outputs[word] = raw_output
+                self._store_output(word, raw_output, ignore_case, ignore_accent)
+        return outputs
+
+    def _run_cruncher_shard(self, words: List[str], ignore_case=False, ignore_accent=False) -> Optional[Dict[str, str]]:
+        """Run one cruncher process over several Beta Code words and split its output by word.
+        
+        Cruncher echoes each input word before its analyses, so the output is split at those
+        echoes. Each word's block keeps its echo line, so it reads the same as cruncher's
+        output for that word on its own. Returns None if the output cannot be matched up
+        with the input words.
+        """
+        try:
+            raw_output = self._run_cruncher("\n".join(words) + "\n", ignore_case, ignore_accent)
+        except subprocess.CalledProcessError as e:
+            print(f"Error processing batch of {len(words)} words: {e}")
+            print(f"stderr: {e.stderr.decode('utf-8', 'replace')}")
+            return None
+        
+        blocks = {}
+        pending = iter(words)
+        expected = next(pending, None)
+        current = None
+        for line in raw_output.splitlines():
+            if expected is not None and line.strip() == expected:
+                current = blocks[expected] = [line]
+                expected = next(pending, None)
+            elif current is not None:
+                current.append(line)
+        
+        if expected is not None:
+            return None
+        return {word: "".join(line + "\n" for line in lines) for word, lines in blocks.items()}
+
+    def _raw_output(self, word: str, ignore_case=False, ignore_accent=False) -> str:
+        """Get cruncher's raw output for one Beta Code word, from the disk cache if it has it."""
+        raw_output = self._cached_output(word, ignore_case, ignore_accent)
+        if raw_output is None:
+            raw_output = self._run_cruncher(word, ignore_case, ignore_accent)
+            self._store_output(word, raw_output, ignore_case, ignore_accent)
+        return raw_output
+
+    def _to_beta_code(self, word: str) -> str:
+        """Convert a Unicode word to Beta Code, keeping an initial or final apostrophe."""
+        # Use standard apostrophe for beta code
+        if word.startswith(_APOSTROPHES):
+            return "'" + beta_code.greek_to_beta_code(word[1:])
+        if word.endswith(_APOSTROPHES):
+            return beta_code.greek_to_beta_code(word[:-1]) + "'"
+        return beta_code.greek_to_beta_code(word)
+
     def _parse_with_morpheus(self, word: str, verbose=False, ignore_case=False, ignore_accent=False) -> List[MorphEntry]:
         """Run the normal Morpheus parsing logic."""
+        debug = verbose or self.debug
         try:
-            # Check for various apostrophe characters that might appear in Unicode text
-            apostrophe_chars = ["'", "ʼ", "'", "᾽", "᾿", "ʻ", "`"]
-            has_initial_apostrophe = any(word.startswith(a) for a in apostrophe_chars)
-            has_final_apostrophe = any(word.endswith(a) for a in apostrophe_chars)
+            has_initial_apostrophe = word.startswith(_APOSTROPHES)
             
             # Store the original word for later reference
             original_word = word
             
             # Ensure word is in Beta Code format for Morpheus
-            # More comprehensive check for Beta Code markers
-            beta_code_markers = set("/*\\()=|<>_^")
-            is_beta_code = any(c in word for c in beta_code_markers)
-            
-            if not is_beta_code:
+            if _BETA_CODE_MARKERS.isdisjoint(word):
                 try:
-                    # Handle apostrophes in Unicode
-                    if has_initial_apostrophe:
-                        # Remove initial apostrophe temporarily, convert to Beta Code, then add it back
-                        apostrophe = "'"  # Use standard apostrophe for beta code
-                        word_without_apostrophe = word[1:]
-                        word = apostrophe + beta_code.greek_to_beta_code(word_without_apostrophe)
-                    elif has_final_apostrophe:
-                        # Remove final apostrophe temporarily, convert to Beta Code, then add it back
-                        apostrophe = "'"  # Use standard apostrophe for beta code
-                        word_without_apostrophe = word[:-1]
-                        word = beta_code.greek_to_beta_code(word_without_apostrophe) + apostrophe
-                    else:
-                        word = beta_code.greek_to_beta_code(word)
+                    word = self._to_beta_code(word)
                 except Exception as e:
                     print(f"Warning: Failed to convert '{word}' to Beta Code: {e}")
                     return []
             
-            # Prepare cruncher command with flags
-            cmd = [self.cruncher_path]
-            if ignore_case:
-                cmd.append("-S")
-            if ignore_accent:
-                cmd.append("-n")
-                
-            if verbose or self.debug:
+            if debug:
                 print(f"\nDEBUG: Sending to morpheus: '{word}'")
                 
-            result = subprocess.run(
-                cmd,
-                input=word,
-                text=True,
-                capture_output=True,
-                env=self.env,
-                check=True
-            )
+            raw_output = self._raw_output(word, ignore_case, ignore_accent)
             
-            if verbose or self.debug:
+            if debug:
                 print(f"\nDEBUG: Raw morpheus output for '{word}':")
-                print(result.stdout)
+                print(raw_output)
                 
             # For words with initial apostrophes, we need to preserve the original apostrophe
             # in the results, so we pass the original word to _parse_output
             return self._parse_output(original_word if has_initial_apostrophe else word, 
-                                    result.stdout, verbose)
+                                    raw_output, verbose)
         except subprocess.CalledProcessError as e:
             print(f"Error processing word '{word}': {e}")
-            print(f"stderr: {e.stderr}")
+            print(f"stderr: {e.stderr.decode('utf-8', 'replace')}")
             return []
 
     def _parse_output(self, original: str, raw_output: str, verbose=False) -> List[MorphEntry]:
+        debug = verbose or self.debug
         entries = []
         matches = re.findall(r"<NL>(.*?)</NL>", raw_output, re.DOTALL)
         
-        if verbose or self.debug:
+        if debug:
             print(f"DEBUG: Found {len(matches)} matches in morpheus output for '{original}'")
         
         for line in matches:
             parts = line.strip().split()
             if not parts or len(parts) < 3:
-                if verbose or self.debug:
+                if debug:
                     print(f"DEBUG: Skipping match, insufficient parts: '{line}'")
                 continue
 
             raw_pos_code = parts[0]
             raw_lemma = parts[1].rstrip(",")
-            lemma = self._get_attic_lemma(raw_lemma)
+            lemma = to_nfc(self._get_attic_lemma(raw_lemma))
 
             split_index = next((i for i, part in enumerate(parts[2:], 2) if "_" in part or "," in part), len(parts))
             raw_features = parts[2:split_index]
             raw_morph_class = " ".join(parts[split_index:])
             
-            if verbose or self.debug:
+            if debug:
                 print(f"DEBUG: Processing match:")
                 print(f"  - POS code: {raw_pos_code}")
                 print(f"  - Lemma: {raw_lemma} -> {lemma}")
@@ -205,24 +511,17 @@ class MorphParser:
                 part_of_speech = self._determine_part_of_speech(raw_pos_code, features, morph_classes)
                 
                 # For words that came in as Unicode (not Beta Code), ensure we return them in Unicode
-                if not any(c in original for c in "/*\\()=|"):
-                    # Handle apostrophe preservation for Unicode input
-                    apostrophe_chars = ["'", "ʼ", "'", "᾽", "᾿", "ʻ", "`"]
-                    if any(original.startswith(a) for a in apostrophe_chars):
-                        # Keep the original apostrophe character
-                        apostrophe = original[0]
-                        # Use the original Unicode word that was passed in
-                        processed_original = original
-                    else:
-                        processed_original = original
+                if _BETA_CODE_INPUT_MARKERS.isdisjoint(original):
+                    # Use the original Unicode word that was passed in, apostrophes included
+                    processed_original = original
                 else:
                     # For Beta Code input, convert to Unicode
                     # If the original has an initial apostrophe, preserve it
                     if original.startswith("'"):
                         original_without_apostrophe = original[1:]
-                        processed_original = "'" + beta_code.beta_code_to_greek(original_without_apostrophe)
+                        processed_original = "'" + beta_code_to_greek(original_without_apostrophe)
                     else:
-                        processed_original = beta_code.beta_code_to_greek(original)
+                        processed_original = beta_code_to_greek(original)
                 
                 # Get the short definition for the lemma
                 short_definition = self.definition_loader.get_definition(lemma)
@@ -238,11 +537,11 @@ class MorphParser:
             except (UnknownPartOfSpeechError, UnknownFeatureError, UnknownMorphClassError) as e:
                 # Log the error but continue processing other entries
                 print(f"Warning while processing '{original}': {e}")
-                if verbose or self.debug:
+                if debug:
                     print(f"DEBUG: Exception details: {type(e).__name__}: {str(e)}")
                 continue
 
-        if len(entries) == 0 and (verbose or self.debug):
+        if len(entries) == 0 and debug:
             print(f"DEBUG: No valid entries found for '{original}'")
             
         return entries
@@ -0,0 +1,86 @@
+import re
+import unicodedata
+from functools import lru_cache
+import beta_code
+
+# Beta Code letters and the Greek letters they stand for
+_BETA_LETTERS = {
+    'a': 'α', 'b': 'β', 'g': 'γ', 'd': 'δ', 'e': 'ε', 'z': 'ζ', 'h': 'η', 'q': 'θ',
+    'i': 'ι', 'k': 'κ', 'l': 'λ', 'm': 'μ', 'n': 'ν', 'c': 'ξ', 'o': 'ο', 'p': 'π',
+    'r': 'ρ', 's': 'σ', 't': 'τ', 'u': 'υ', 'f': 'φ', 'x': 'χ', 'y': 'ψ', 'w': 'ω',
+}
+
+# Beta Code diacritics and the combining marks they stand for
+_BETA_DIACRITICS = {
+    ')': '\u0313',  # smooth breathing
+    '(': '\u0314',  # rough breathing
+    '/': '\u0301',  # acute
+    '\\': '\u0300', # grave
+    '=': '\u0342',  # circumflex
+    '+': '\u0308',  # diaeresis
+    '|': '\u0345',  # iota subscript
+}
+
+# Built once at import; str.translate does the per-character work in C. Capital letters
+# are written as uppercase Latin letters once _BETA_CAPITAL has moved the asterisk.
+_BETA_TO_GREEK = str.maketrans({
+    **_BETA_LETTERS,
+    **{beta.upper(): greek.upper() for beta, greek in _BETA_LETTERS.items()},
+    **_BETA_DIACRITICS,
+})
+
+# A capital: asterisk, then any breathing and accent, then the letter (e.g. *)/a for Ἄ)
+_BETA_CAPITAL = re.compile(r"\*([)(]?[/\\=]?)([a-z])")
+
+# Beta Code with diacritics in canonical order (breathing, diaeresis, accent, iota subscript)
+# on vowels and breathing on rho. This is the form Morpheus emits for lemmas; anything else
+# (punctuation, sigma variants, capitals with iota adscript) goes to the beta_code library.
+_SIMPLE_BETA_CODE = re.compile(
+    r"(?:[aehiouw][)(]?\+?[/\\=]?\|?|[AEHIOUW][)(]?[/\\=]?|[rR][)(]?|[bgdzqklmncpstfxyBGDZQKLMNCPSTFXY])+")
+
+_COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+
+
+@lru_cache(maxsize=4096)
+def beta_code_to_greek(text: str) -> str:
+    """Convert Beta Code to Unicode Greek, using a precomputed translation table when possible.
+
+    Drop-in replacement for beta_code.beta_code_to_greek. Simple words, including capitals
+    like *)aqh=nai, with an optional trailing homograph number (e.g. le/gw1) are converted
+    with str.translate and NFC composition; everything else falls back to the beta_code
+    library. Results are memoized, since the same lemmas come back from morpheus over and
+    over.
+
+    Args:
+        text: The Beta Code string
+
+    Returns:
+        The Unicode Greek string
+    """
+    letters = text.rstrip('0123456789')
+    digits = text[len(letters):]
+    if not letters.islower():
+        # Uppercase letters mean TLG-style Beta Code; leave it to the library
+        return beta_code.beta_code_to_greek(text)
+    if '*' in letters:
+        letters = _BETA_CAPITAL.sub(lambda m: m.group(2).upper() + m.group(1), letters)
+    if not _SIMPLE_BETA_CODE.fullmatch(letters) or (digits and letters.endswith('s')):
+        return beta_code.beta_code_to_greek(text)
+
+    greek = unicodedata.normalize('NFC', letters.translate(_BETA_TO_GREEK))
+    if _COMBINING_MARKS.search(greek):
+        # A diacritic combination with no precomposed character; let the library decide
+        return beta_code.beta_code_to_greek(text)
+    if greek.endswith('σ'):
+        greek = greek[:-1] + 'ς'
+    return greek + digits
+
+
+def to_nfc(text: str) -> str:
+    """Compose Greek text to NFC, the form used for every lookup and cache key.
+
+    Text that is already composed, by far the usual case, costs only the Unicode quick
+    check that unicodedata.normalize runs first; it is returned unchanged. Call this once
+    where text comes in, not again further down.
+    """
+    return unicodedata.normalize('NFC', text)
@@ -0,0 +1,55 @@
+from functools import cached_property
+from typing import Dict, List, Tuple
+from .morph_entry import MorphEntry
+from .part_of_speech import PartOfSpeech
+from .features import Feature
+from .morph_class import MorphClass
+
+class ParseResult(list):
+    """The MorphEntry objects parsed for a word, indexed by part of speech, feature and morph class.
+    
+    Adjective entries (those whose morph classes mark an adjective) are also collected.
+    
+    Behaves exactly like a list of entries. The indexes are built together in a single pass
+    the first time one of them is used, and reflect the entries at that point, so make a new
+    ParseResult rather than changing one whose indexes have been used.
+    """
+
+    @cached_property
+    def _indexes(self) -> Tuple[Dict[PartOfSpeech, List[MorphEntry]],
+                                Dict[Feature, List[MorphEntry]],
+                                Dict[MorphClass, List[MorphEntry]],
+                                List[MorphEntry]]:
+        by_pos: Dict[PartOfSpeech, List[MorphEntry]] = {}
+        by_feature: Dict[Feature, List[MorphEntry]] = {}
+        by_morph_class: Dict[MorphClass, List[MorphEntry]] = {}
+        adjective_entries: List[MorphEntry] = []
+        for entry in self:
+            by_pos.setdefault(entry.part_of_speech, []).append(entry)
+            for feature in entry.features:
+                by_feature.setdefault(feature, []).append(entry)
+            for morph_class in entry.morph_classes:
+                by_morph_class.setdefault(morph_class, []).append(entry)
+            if MorphClass.is_adjective(entry.morph_classes):
+                adjective_entries.append(entry)
+        return by_pos, by_feature, by_morph_class, adjective_entries
+
+    @property
+    def by_pos(self) -> Dict[PartOfSpeech, List[MorphEntry]]:
+        """Entries grouped by part of speech, in parse order."""
+        return self._indexes[0]
+
+    @property
+    def by_feature(self) -> Dict[Feature, List[MorphEntry]]:
+        """Entries grouped by each of their features, in parse order."""
+        return self._indexes[1]
+
+    @property
+    def by_morph_class(self) -> Dict[MorphClass, List[MorphEntry]]:
+        """Entries grouped by each of their morph classes, in parse order."""
+        return self._indexes[2]
+
+    @property
+    def adjective_entries(self) -> List[MorphEntry]:
+        """Entries whose morph classes mark an adjective, in parse order."""
+        return self._indexes[3]
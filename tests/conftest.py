@@ -0,0 +1,25 @@
+import pytest
+from tests.shared_parser import get_shared_parser
+from vocab.text_processor import TextProcessor
+
+def pytest_configure(config):
+    # Registered here too so the marker is known when pytest-xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run these tests on one pytest-xdist worker (--dist loadgroup)")
+
+@pytest.fixture(scope="session")
+def morph_parser():
+    """Provide one MorphParser for the whole session.
+    
+    Under pytest-xdist (pytest -n auto) each worker is its own process, so each
+    worker gets exactly one parser and its own parse cache.
+    """
+    return get_shared_parser()
+
+@pytest.fixture(scope="session")
+def text_processor(morph_parser):
+    """Provide one TextProcessor over the session parser.
+    
+    TextProcessor keeps no per-text state, so sharing it is as safe as sharing the parser.
+    """
+    return TextProcessor(morph_parser)
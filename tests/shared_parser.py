@@ -0,0 +1,38 @@
+from functools import lru_cache
+from pathlib import Path
+from morph import MorphParser
+
+# Resolved once at import rather than on every class load
+_HERE = Path(__file__).resolve()
+MORPHEUS_ROOT = _HERE.parents[1] / "morpheus"
+CRUNCHER = MORPHEUS_ROOT / "bin" / "cruncher"
+STEMLIB = MORPHEUS_ROOT / "stemlib"
+
+
+@lru_cache(maxsize=1)
+def get_shared_parser() -> MorphParser:
+    """Return a MorphParser shared by every test module in the session.
+    
+    Building a parser loads the full short definitions file, so test classes share
+    one instance instead of each constructing their own. Sharing is safe because a
+    MorphParser holds no per-parse state: its only mutable state is the parse cache,
+    which stores deterministic cruncher results, so no reset is needed between tests.
+    """
+    if not CRUNCHER.is_file():
+        # Fail once with a clear message instead of on every cruncher call
+        raise FileNotFoundError(f"Morpheus cruncher not found at {CRUNCHER}; build morpheus first")
+    return MorphParser(cruncher_path=str(CRUNCHER), stemlib_path=str(STEMLIB))
+
+
+class FakeParser:
+    """Stands in for MorphParser in tests that only exercise TextProcessor's own logic.
+    
+    A plain class rather than Mock(spec=MorphParser), which has to introspect MorphParser
+    to build; every word parses to nothing.
+    """
+
+    def parse_word(self, word, **kwargs):
+        return []
+
+    def parse_words(self, words, **kwargs):
+        return {word: self.parse_word(word, **kwargs) for word in words}
@@ -1,477 +1,101 @@
-import unittest
+import csv
+import logging
 import os
-from morph import MorphParser
-from morph.part_of_speech import PartOfSpeech, UnknownPartOfSpeechError
-from morph.features import Feature, UnknownFeatureError
-from morph.morph_class import MorphClass, UnknownMorphClassError
-import beta_code
-from parameterized import parameterized
+from pathlib import Path
+import pytest
 
 # This file contains tests for parsing words from the opening lines of Aristophanes' Frogs
 # Extracted from test_morph_parser.py to keep the main test file focused
 
-class TestFrogsOpening(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        # Get the project root directory
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        morpheus_root = os.path.join(current_dir, "morpheus")
-        cruncher = os.path.join(morpheus_root, "bin", "cruncher")
-        stemlib = os.path.join(morpheus_root, "stemlib")
+log = logging.getLogger(__name__)
+
+# Keep the Frogs cases on one xdist worker so the batched parse in frogs_results runs only once
+pytestmark = pytest.mark.xdist_group("frogs")
+
+# Set GVT_VERBOSE_TESTS=1 to log every parsed word and dump raw morpheus output for failures
+_VERBOSE_TESTS = bool(os.environ.get("GVT_VERBOSE_TESTS"))
+if _VERBOSE_TESTS:
+    log.setLevel(logging.DEBUG)
+
+_FROGS_PAIRS_PATH = Path(__file__).resolve().parent / "data" / "frogs_pairs.tsv"
+
+def _load_frogs_pairs():
+    """Load the (beta_code, unicode) pair for each word tested from tests/data/frogs_pairs.tsv.
+    
+    The file has beta_code, unicode and an optional English gloss per line; lines starting
+    with # are comments.
+    """
+    with open(_FROGS_PAIRS_PATH, encoding="utf-8", newline="") as f:
+        return tuple((row[0], row[1]) for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+                     if row and not row[0].startswith("#"))
+
+# (beta_code, unicode) pairs for each word tested
+FROGS_PAIRS = _load_frogs_pairs()
+
+# Words known to be unrecognized by Morpheus
+_KNOWN_UNRECOGNIZED = frozenset({"kentaurikw=s", "a)papai/"})
+
+def _group_by_beta_code(pairs):
+    """Group (beta_code, unicode) pairs into one (beta_code, unicode_forms) case per Beta Code word.
+    
+    Words repeat across the lines, and a Beta Code word can appear with more than one
+    Unicode spelling (ὦ/ὢ); each gets one test, with its Unicode spellings as fallbacks.
+    """
+    groups = {}
+    for beta_code_word, unicode_word in pairs:
+        groups.setdefault(beta_code_word, {})[unicode_word] = None
+    return [(beta_code_word, tuple(unicode_words)) for beta_code_word, unicode_words in groups.items()]
+
+FROGS_CASES = _group_by_beta_code(FROGS_PAIRS)
+
+@pytest.fixture(scope="module")
+def frogs_results(morph_parser):
+    """Parse every word up front with one cruncher run per format instead of one per word.
+    
+    Beta Code is morpheus's native input, so the Unicode form is only tried when it fails.
+    Cruncher's raw output for the Beta Code words is kept for the verbose failure report.
+    """
+    raw_outputs = {}
+    results_beta = morph_parser.parse_words((beta for beta, _ in FROGS_CASES), raw_outputs=raw_outputs)
+    results_unicode = morph_parser.parse_words(
+        unicode for beta, unicode_words in FROGS_CASES if not results_beta[beta]
+        for unicode in unicode_words)
+    return results_beta, results_unicode, raw_outputs
+
+@pytest.mark.parametrize("beta_code_word,unicode_words", FROGS_CASES,
+                         ids=[beta for beta, _ in FROGS_CASES])
+def test_frogs_word(morph_parser, frogs_results, beta_code_word, unicode_words):
+    """Test parsing individual words from Aristophanes' Frogs"""
+    # Try both formats - if either works, the test passes
+    
+    # Add special handling for words known to be unrecognized by Morpheus
+    if beta_code_word in _KNOWN_UNRECOGNIZED:
+        pytest.skip(f"Known unrecognized word: {beta_code_word}")
         
-        cls.parser = MorphParser(cruncher_path=cruncher, stemlib_path=stemlib)
-
-    # The actual test will be copied here from the original file
-class TestFrogsOpening(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        # Get the project root directory
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        morpheus_root = os.path.join(current_dir, "morpheus")
-        cruncher = os.path.join(morpheus_root, "bin", "cruncher")
-        stemlib = os.path.join(morpheus_root, "stemlib")
-        
-        cls.parser = MorphParser(cruncher_path=cruncher, stemlib_path=stemlib)
-
-    @parameterized.expand([
-        # Lines 1-10 (existing)
-        ("ei)/pw", "εἴπω"),           # "Shall I tell"
-        ("ti", "τι"),                 # "something"
-        ("tw=n", "τῶν"),              # "of the"
-        ("ei)wqo/twn", "εἰωθότων"),   # "usual"
-        ("w)=", "ὦ"),                 # "O"
-        ("de/spota", "δέσποτα"),      # "master"
-        ("e)f'", "ἐφ᾽"),              # "at"
-        ("oi(=s", "οἷς"),             # "which"
-        ("a)ei\\", "ἀεὶ"),            # "always"
-        ("gelw=sin", "γελῶσιν"),      # "laugh"
-        ("oi(", "οἱ"),                # "the"
-        ("qew/menoi", "θεώμενοι"),    # "spectators"
-        ("nh\\", "νὴ"),               # "Yes by"
-        ("to\\n", "τὸν"),             # "the"
-        ("di/'", "Δί᾽"),              # "Zeus"
-        ("o(/", "ὅ"),                 # "whatever"
-        ("bou/lei", "βούλει"),        # "you like"
-        ("ge", "γε"),                 # (emphatic)
-        ("plh\\n", "πλὴν"),           # "except"
-        ("pie/zomai", "πιέζομαι"),    # "I'm being squeezed"
-
-        # Lines 11-35 (new)
-        ("mh\\", "μὴ"),               # "not"
-        ("dh=q'", "δῆθ᾽"),            # "indeed"
-        ("i(keteu/w", "ἱκετεύω"),     # "I beseech"
-        ("o(/tan", "ὅταν"),           # "when"
-        ("me/llw", "μέλλω"),          # "I am about to"
-        ("e)cemei=n", "ἐξεμεῖν"),     # "vomit"
-
-        ("ti/", "τί"),                # "what"
-        ("dh=t'", "δῆτ᾽"),            # "then"
-        ("e)/dei", "ἔδει"),           # "was necessary"
-        ("me", "με"),                 # "me"
-        ("tau=ta", "ταῦτα"),          # "these"
-        ("ta\\", "τὰ"),               # "the"
-        ("skeu/h", "σκεύη"),          # "equipment"
-        ("fe/rein", "φέρειν"),        # "to carry"
-
-        ("ei)/per", "εἴπερ"),         # "if indeed"
-        ("poih/sw", "ποιήσω"),        # "I will do"
-        ("mhde\\n", "μηδὲν"),         # "nothing"
-        ("w(=nper", "ὧνπερ"),         # "of which"
-        ("fru/nixos", "Φρύνιχος"),    # "Phrynichus"
-        ("ei)/wqe", "εἴωθε"),         # "is accustomed"
-        ("poiei=n", "ποιεῖν"),        # "to do"
-        ("kai\\", "καὶ"),             # "and"
-        ("lu/kis", "Λύκις"),          # "Lycis"
-        ("ka)meiyi/as", "κἀμειψίας"), # "and Ameipsias"
-
-        ("mh/", "μή"),                # "not"
-        ("nun", "νυν"),               # "now"
-        ("poih/sh|s", "ποιήσῃς"),     # "may you do"
-        ("w(s", "ὡς"),                # "as"
-        ("e)gw\\", "ἐγὼ"),            # "I"
-        ("qew/menos", "θεώμενος"),    # "watching"
-
-        ("o(/tan", "ὅταν"),           # "whenever"
-        ("ti", "τι"),                 # "something"
-        ("tou/twn", "τούτων"),        # "of these"
-        ("tw=n", "τῶν"),              # "the"
-        ("sofisma/twn", "σοφισμάτων"), # "clever tricks"
-        ("i)/dw", "ἴδω"),             # "I see"
-
-        ("plei=n", "πλεῖν"),          # "more"
-        ("h)/", "ἢ"),                 # "than"
-        ("e)niautw=|", "ἐνιαυτῷ"),    # "a year"
-        ("presbu/teros", "πρεσβύτερος"), # "older"
-        ("a)pe/rxomai", "ἀπέρχομαι"), # "I go away"
-
-        # The neck complaint
-        ("w)=", "ὢ"),                 # "oh"
-        ("triskakodai/mwn", "τρισκακοδαίμων"), # "thrice-cursed"
-        ("a)/r", "ἄρ᾽"),              # "then"
-        ("o(", "ὁ"),                  # "the"
-        ("tra/xhlos", "τράχηλος"),    # "neck"
-        ("ou(tosi/", "οὑτοσί"),       # "this here"
-        ("o(/ti", "ὅτι"),             # "because"
-        ("qli/betai", "θλίβεται"),    # "is pressed"
-        ("me/n", "μέν"),              # "indeed"
-        ("to\\", "τὸ"),               # "the"
-        ("de\\", "δὲ"),               # "but"
-        ("ge/loion", "γέλοιον"),      # "joke"
-        ("ou)k", "οὐκ"),              # "not"
-        ("e)rei=", "ἐρεῖ"),           # "will say"
-
-        # Dionysus' complaint about hubris
-        ("ei)=t'", "εἶτ᾽"),           # "then"
-        ("ou)x", "οὐχ"),              # "not"
-        ("u(/bris", "ὕβρις"),         # "hubris"
-        ("tau=t'", "ταῦτ᾽"),          # "these things"
-        ("e)sti\\", "ἐστὶ"),          # "is"
-        ("kai\\", "καὶ"),             # "and"
-        ("pollh\\", "πολλὴ"),         # "much"
-        ("trufh/", "τρυφή"),          # "luxury"
-        ("o(/t'", "ὅτ᾽"),             # "when"
-        ("e)gw\\", "ἐγὼ"),            # "I"
-        ("me\\n", "μὲν"),             # "indeed"
-        ("w)\n", "ὢν"),               # "being"
-        ("dio/nusos", "Διόνυσος"),    # "Dionysus"
-        ("ui(o\\s", "υἱὸς"),          # "son"
-        ("stamni/ou", "Σταμνίου"),    # "of Wine-jar"
-        ("au)to\\s", "αὐτὸς"),        # "myself"
-        ("badi/zw", "βαδίζω"),        # "walk"
-        ("ponw=", "πονῶ"),            # "toil"
-        ("tou=ton", "τοῦτον"),        # "this one"
-        ("d'", "δ᾽"),                 # "but"
-        ("o)xw=", "ὀχῶ"),             # "I carry"
-        ("i(/na", "ἵνα"),             # "so that"
-        ("mh\\", "μὴ"),               # "not"
-        ("talaipwroi=to", "ταλαιπωροῖτο"), # "he might suffer"
-        ("mhd'", "μηδ᾽"),             # "nor"
-        ("a)/xqos", "ἄχθος"),         # "burden"
-        ("fe/roi", "φέροι"),          # "might carry"
-
-        # Exchange about carrying and the donkey
-        ("ou)", "οὐ"),                # "not"
-        ("ga\\r", "γὰρ"),             # "for"
-        ("fe/rw", "φέρω"),            # "I carry"
-        ("'gw/", "γώ"),               # "I"
-        ("pw=s", "πῶς"),              # "how"
-        ("fe/reis", "φέρεις"),        # "you carry"
-        ("o(/s", "ὅς"),               # "who"
-        ("g'", "γ᾽"),                 # (emphatic)
-        ("o)xei=", "ὀχεῖ"),           # "are carried"
-        ("fe/rwn", "φέρων"),          # "carrying"
-        ("ge", "γε"),                 # (emphatic)
-        ("tauti/", "ταυτί"),          # "these things"
-        ("ti/na", "τίνα"),            # "what"
-        ("tro/pon", "τρόπον"),        # "way"
-        ("bare/ws", "βαρέως"),        # "heavily"
-        ("pa/nu", "πάνυ"),            # "very"
-        ("ou)/koun", "οὔκουν"),       # "not then"
-        ("ba/ros", "βάρος"),          # "weight"
-        ("tou=q'", "τοῦθ᾽"),          # "this"
-        ("o(\\", "ὃ"),                # "which"
-        ("su\\", "σὺ"),               # "you"
-        ("o)/nos", "ὄνος"),           # "donkey"
-        ("dh=q'", "δῆθ᾽"),            # "indeed"
-        ("o(/", "ὅ"),                 # "which"
-        ("g'", "γ᾽"),                 # (emphatic)
-        ("e)/xw", "ἔχω"),             # "I have"
-        ("'gw\\", "γὼ"),              # "I"
-        ("ma\\", "μὰ"),               # "by"
-        ("di/'", "Δί᾽"),              # "Zeus"
-        ("ou)/", "οὔ"),               # "not"
-        ("ga\\r", "γὰρ"),             # "for"
-        ("au)to\\s", "αὐτὸς"),        # "self"
-        ("u(f'", "ὑφ᾽"),              # "by"
-        ("e(te/rou", "ἑτέρου"),       # "another"
-        ("oi)=d'", "οἶδ᾽"),           # "I know"
-        ("w)=mos", "ὦμος"),           # "shoulder"
-        ("pie/zetai", "πιέζεται"),    # "is pressed"
-
-        # Final lines about the door
-        ("su\\", "σὺ"),               # "you"
-        ("d'", "δ᾽"),                 # "but"
-        ("ou)=n", "οὖν"),             # "therefore"
-        ("e)peidh\\", "ἐπειδὴ"),      # "since"
-        ("to\\n", "τὸν"),             # "the"
-        ("o)/non", "ὄνον"),           # "donkey"
-        ("ou)", "οὐ"),                # "not"
-        ("fh\\|s", "φῄς"),            # "you say"
-        ("s'", "σ᾽"),                 # "you"
-        ("w)felei=n", "ὠφελεῖν"),     # "to help"
-        ("e)n", "ἐν"),                # "in"
-        ("tw=|", "τῷ"),               # "the"
-        ("me/rei", "μέρει"),          # "turn"
-        ("a)ra/menos", "ἀράμενος"),   # "having lifted"
-        ("oi)/moi", "οἴμοι"),         # "alas"
-        ("kakodai/mwn", "κακοδαίμων"), # "ill-fated"
-        ("ti/", "τί"),                # "why"
-        ("e)gw\\", "ἐγὼ"),            # "I"
-        ("ou)k", "οὐκ"),              # "not"
-        ("e)nauma/xoun", "ἐναυμάχουν"), # "fought in sea-battle"
-        ("h)=", "ἦ"),                 # "truly"
-        ("ta)/n", "τἄν"),             # "would"
-        ("se", "σε"),                 # "you"
-        ("kwku/ein", "κωκύειν"),      # "to wail"
-        ("a)/n", "ἂν"),               # (modal particle)
-        ("e)ke/leuon", "ἐκέλευον"),   # "I would bid"
-        ("makra/", "μακρά"),          # "at length"
-        ("kata/ba", "κατάβα"),        # "get down"
-        ("panou=rge", "πανοῦργε"),    # "scoundrel"
-        ("kai\\", "καὶ"),             # "and"
-        ("e)ggu\\s", "ἐγγὺς"),        # "near"
-        ("th=s", "τῆς"),              # "the"
-        ("qu/ras", "θύρας"),          # "door"
-        ("h)/dh", "ἤδη"),             # "already"
-        ("badi/zwn", "βαδίζων"),      # "walking"
-        ("ei)mi\\", "εἰμὶ"),          # "I am"
-        ("th=sd'", "τῆσδ᾽"),          # "this"
-        ("oi(=", "οἷ"),               # "where"
-        ("prw=ta/", "πρῶτά"),         # "first"
-        ("me", "με"),                 # "me"
-        ("e)/dei", "ἔδει"),           # "it was necessary"
-        ("trape/sqai", "τραπέσθαι"),  # "to turn"
-        ("paidi/on", "παιδίον"),      # "slave"
-        ("pai=", "παῖ"),              # "boy"
-        ("h)mi/", "ἠμί"),             # "I say"
-
-        # Heracles' entrance (lines 36-60)
-        ("h(raklh=s", "Ἡρακλῆς"),      # "Heracles"
-        ("ti/s", "τίς"),               # "who"
-        ("th\\n", "τὴν"),              # "the"
-        ("qu/ran", "θύραν"),           # "door"
-        ("e)pa/tacen", "ἐπάταξεν"),    # "knocked"
-        ("w(s", "ὡς"),                 # "how"
-        # Skipping known words not recognized by Morpheus
-        # ("kentaurikw=s", "κενταυρικῶς"), # "centaur-like"
-        ("e)nh/laq'", "ἐνήλαθ᾽"),      # "leaped in"
-        ("o(/stis", "ὅστις"),          # "whoever"
-        ("ei)pe/", "εἰπέ"),            # "tell"
-        ("moi", "μοι"),                # "me"
-        ("touti\\", "τουτὶ"),          # "this here"
-        ("ti/", "τί"),                 # "what"
-        ("h)=n", "ἦν"),                # "was"
-
-        ("o(", "ὁ"),                   # "the"
-        ("pai=s", "παῖς"),             # "boy/slave"
-
-        ("ti/", "τί"),                 # "what"
-        ("e)/stin", "ἔστιν"),          # "is it"
-
-        ("ou)k", "οὐκ"),               # "not"
-        ("e)nequmh/qhs", "ἐνεθυμήθης"), # "did you notice"
-
-        ("to\\", "τὸ"),                # "the"
-        ("ti/", "τί"),                 # "what"
-
-        ("w(s", "ὡς"),                 # "how"
-        ("sfo/dra", "σφόδρα"),         # "greatly"
-        ("m'", "μ᾽"),                  # "me"
-        ("e)/deise", "ἔδεισε"),        # "he feared"
-
-        ("nh\\", "νὴ"),                # "by"
-        ("di/a", "Δία"),               # "Zeus"
-        ("mh\\", "μὴ"),                # "not"
-        ("mai/noio/", "μαίνοιό"),      # "may you be mad"
-        ("ge", "γε"),                  # (emphatic)
-
-        ("ou)/", "οὔ"),                # "not"
-        ("toi", "τοι"),                # "indeed"
-        ("ma\\", "μὰ"),                # "by"
-        ("th\\n", "τὴν"),              # "the"
-        ("dh/mhtra", "Δήμητρα"),       # "Demeter"
-        ("du/namai", "δύναμαι"),       # "I am able"
-        ("mh\\", "μὴ"),                # "not"
-        ("gela=n", "γελᾶν"),           # "to laugh"
-
-        ("kai/toi", "καίτοι"),         # "and yet"
-        ("da/knw", "δάκνω"),           # "I bite"
-        ("g'", "γ᾽"),                  # (emphatic)
-        ("e)mauto/n", "ἐμαυτόν"),      # "myself"
-        ("a)ll'", "ἀλλ᾽"),             # "but"
-        ("o(/mws", "ὅμως"),            # "nevertheless"
-        ("gelw=", "γελῶ"),             # "I laugh"
-
-        ("w)=", "ὦ"),                  # "O"
-        ("daimo/nie", "δαιμόνιε"),     # "good sir"
-        ("pro/selqe", "πρόσελθε"),     # "come here"
-        ("de/omai", "δέομαι"),         # "I need"
-        ("ga/r", "γάρ"),               # "for"
-        ("ti/", "τί"),                 # "something"
-        ("sou", "σου"),                # "from you"
-
-        ("a)ll'", "ἀλλ᾽"),             # "but"
-        ("ou)x", "οὐχ"),               # "not"
-        ("oi(=o/s", "οἷός"),           # "able"
-        ("t'", "τ᾽"),                  # (elision)
-        ("ei)m'", "εἴμ᾽"),             # "I am"
-        ("a)posobh=sai", "ἀποσοβῆσαι"), # "to drive away"
-        ("to\\n", "τὸν"),              # "the"
-        ("ge/lwn", "γέλων"),           # "laughter"
-
-        ("o(rw=n", "ὁρῶν"),            # "seeing"
-        ("leonth=n", "λεοντῆν"),       # "lion-skin"
-        ("e)pi\\", "ἐπὶ"),             # "upon"
-        ("krokwtw=|", "κροκωτῷ"),      # "saffron robe"
-        ("keime/nhn", "κειμένην"),     # "lying"
-
-        ("ti/s", "τίς"),               # "what"
-        ("o(", "ὁ"),                   # "the"
-        ("nou=s", "νοῦς"),             # "meaning"
-        ("ti/", "τί"),                 # "what"
-        ("ko/qornos", "κόθορνος"),     # "buskin"
-        ("kai\\", "καὶ"),              # "and"
-        ("r(o/palon", "ῥόπαλον"),      # "club"
-        ("cunhlqe/thn", "ξυνηλθέτην"), # "came together"
-
-        ("poi=", "ποῖ"),               # "where"
-        ("gh=s", "γῆς"),               # "of earth"
-        ("a)pedh/meis", "ἀπεδήμεις"),  # "were you abroad"
-
-        ("e)peba/teuon", "ἐπεβάτευον"), # "I served"
-        ("kleisqe/nei", "Κλεισθένει"), # "for Cleisthenes"
-
-        ("k)anau/ma/xhsas", "κἀναυμάχησας"), # "and did you fight at sea"
-
-        ("kai\\", "καὶ"),              # "and"
-        ("katedu/same/n", "κατεδύσαμέν"), # "we sank"
-        ("ge", "γε"),                  # (emphatic)
-        ("nau=s", "ναῦς"),             # "ships"
-
-        ("tw=n", "τῶν"),               # "of the"
-        ("polemi/wn", "πολεμίων"),     # "enemies"
-        ("h)/", "ἢ"),                  # "either"
-        ("dw/dek'", "δώδεκ᾽"),         # "twelve"
-        ("h)/", "ἢ"),                  # "or"
-        ("trei=s", "τρεῖς"),           # "three"
-        ("kai\\", "καὶ"),              # "and"
-        ("de/ka", "δέκα"),             # "ten"
-
-        ("sfw/", "σφώ"),               # "you two"
-
-        ("nh\\", "νὴ"),                # "by"
-        ("to\\n", "τὸν"),              # "the"
-        ("a)po/llw", "Ἀπόλλω"),        # "Apollo"
-
-        ("ka)=|t'", "κᾆτ᾽"),           # "and then"
-        ("e)/gwg'", "ἔγωγ᾽"),          # "I"
-        ("e)chgro/mhn", "ἐξηγρόμην"),  # "woke up"
-
-        ("kai\\", "καὶ"),              # "and"
-        ("dh=t'", "δῆτ᾽"),             # "indeed"
-        ("e)pi\\", "ἐπὶ"),             # "on"
-        ("th=s", "τῆς"),               # "the"
-        ("new\\s", "νεὼς"),            # "ship"
-        ("a)nagignw/skonti/", "ἀναγιγνώσκοντί"), # "reading"
-        ("moi", "μοι"),                # "to me"
-
-        ("th\\n", "τὴν"),              # "the"
-        ("a)ndrome/dan", "Ἀνδρομέδαν"), # "Andromeda"
-        ("pro\\s", "πρὸς"),            # "to"
-        ("e)mauto\\n", "ἐμαυτὸν"),     # "myself"
-        ("e)cai/fnhs", "ἐξαίφνης"),    # "suddenly"
-        ("po/qos", "πόθος"),           # "desire"
-
-        ("th\\n", "τὴν"),              # "the"
-        ("kardi/an", "καρδίαν"),       # "heart"
-        ("e)pa/tace", "ἐπάταξε"),      # "struck"
-        ("pw=s", "πῶς"),               # "how"
-        ("oi)/ei", "οἴει"),            # "do you think"
-        ("sfo/dra", "σφόδρα"),         # "strongly"
-
-        ("po/qos", "πόθος"),           # "desire"
-        ("po/sos", "πόσος"),           # "how great"
-        ("tis", "τις"),                # "some"
-
-        ("mikro\\s", "μικρὸς"),        # "small"
-        ("h(li/kos", "ἡλίκος"),        # "as big as"
-        ("mo/lwn", "Μόλων"),           # "Molon"
-
-        ("gunaiko/s", "γυναικός"),     # "for a woman"
-
-        ("ou)", "οὐ"),                 # "not"
-        ("dh=t'", "δῆτ᾽"),             # "indeed"
-
-        ("a)lla\\", "ἀλλὰ"),           # "but"
-        ("paido/s", "παιδός"),         # "for a boy"
-
-        ("ou)damw=s", "οὐδαμῶς"),      # "not at all"
-
-        ("a)ll'", "ἀλλ᾽"),             # "but"
-        ("a)ndro/s", "ἀνδρός"),        # "for a man"
-
-        # Skipping known words not recognized by Morpheus
-        # ("a)papai/", "ἀπαπαί"),        # (exclamation)
-
-        ("cune/genou", "ξυνεγένου"),   # "did you associate with"
-        ("tw=|", "τῷ"),                # "with"
-        ("kleisqe/nei", "Κλεισθένει"), # "Cleisthenes"
-
-        ("mh\\", "μὴ"),                # "don't"
-        ("skw=pte/", "σκῶπτέ"),        # "mock"
-        ("m'", "μ᾽"),                  # "me"
-        ("w)=de/lf'", "ὦδέλφ᾽"),       # "brother"
-        ("ou)", "οὐ"),                 # "not"
-        ("ga\\r", "γὰρ"),              # "for"
-        ("a)ll'", "ἀλλ᾽"),             # "but"
-        ("e)/xw", "ἔχω"),              # "I am"
-        ("kakw=s", "κακῶς"),           # "badly"
-
-        ("toiou=tos", "τοιοῦτος"),     # "such"
-        ("i(/mero/s", "ἵμερός"),        # "desire"
-        ("me", "με"),                  # "me"
-        ("dialumai/netai", "διαλυμαίνεται"), # "torments"
-    ])
-    def test_frogs_word(self, beta_code_word, unicode_word):
-        """Test parsing individual words from Aristophanes' Frogs"""
-        # Try both formats - if either works, the test passes
-        
-        # Add special handling for words known to be unrecognized by Morpheus
-        known_unrecognized = ["kentaurikw=s", "a)papai/"]
-        if beta_code_word in known_unrecognized:
-            print(f"Skipping known unrecognized word: {beta_code_word}")
-            return
+    results_beta, results_unicode_by_word, raw_outputs = frogs_results
+    results_beta = results_beta[beta_code_word]
+    results_unicode = next((results_unicode_by_word[unicode] for unicode in unicode_words
+                            if results_unicode_by_word.get(unicode)), [])
+    unicode_word = "/".join(unicode_words)
+    success = len(results_beta) > 0 or len(results_unicode) > 0
+    
+    if not success and _VERBOSE_TESTS:
+        # Get raw output from Morpheus, from the batch if it ran cruncher for this word
+        try:
+            raw_output = raw_outputs.get(beta_code_word)
+            if raw_output is None:
+                raw_output = morph_parser.debug_parse(beta_code_word)
+            log.error("Raw Morpheus output for failing word %s / %s:\n%s",
+                      beta_code_word, unicode_word, raw_output)
+        except Exception as e:
+            log.error("Error running Morpheus directly for %s: %s", beta_code_word, e)
             
-        # Add verbose debugging for problematic words
-        verbose = beta_code_word in ["kentaurikw=s", "a)papai/"]
-        
-        results_beta = self.parser.parse_word(beta_code_word, verbose=verbose)
-        results_unicode = self.parser.parse_word(unicode_word, verbose=verbose)
-        success = len(results_beta) > 0 or len(results_unicode) > 0
-        
-        if not success and verbose:
-            print(f"\nDETAILED DEBUG for failing word: {beta_code_word} / {unicode_word}")
-            # Get raw output from Morpheus
-            print("Trying raw Morpheus command...")
-            import subprocess
-            import os
-            
-            env = os.environ.copy()
-            env["MORPHLIB"] = os.environ.get("MORPHLIB", "")  # Use the environment's MORPHLIB
-            
-            try:
-                result = subprocess.run(
-                    [self.parser.cruncher_path],
-                    input=beta_code_word,
-                    text=True,
-                    capture_output=True,
-                    env=env,
-                    check=True
-                )
-                print("Raw Morpheus output:")
-                print(result.stdout)
-            except Exception as e:
-                print(f"Error running Morpheus directly: {e}")
-                
-        self.assertTrue(success, f"Failed to parse both {beta_code_word} and {unicode_word}")
-        
-        # Print debug info for whichever version worked
-        results = results_beta if len(results_beta) > 0 else results_unicode
-        if len(results) > 0:
-            entry = results[0]
-            print(f"{unicode_word} ({beta_code_word}): {entry.lemma} - {', '.join(str(f) for f in entry.features)}")
-        elif verbose:
-            print(f"No results found for {unicode_word} ({beta_code_word})")
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    assert success, f"Failed to parse both {beta_code_word} and {unicode_word}"
+    
+    # Log debug info for whichever version worked (success was asserted above), only
+    # when verbose tests are requested
+    results = results_beta if len(results_beta) > 0 else results_unicode
+    if _VERBOSE_TESTS:
+        entry = results[0]
+        log.debug("%s (%s): %s - %s", unicode_word, beta_code_word, entry.lemma,
+                  ", ".join(str(f) for f in entry.features))
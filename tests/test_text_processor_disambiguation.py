@@ -1,18 +1,18 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from vocab.text_processor import TextProcessor
 from morph.morph_entry import MorphEntry
 from morph.part_of_speech import PartOfSpeech
 from morph.features import Feature
 from morph.morph_class import MorphClass
+from tests.shared_parser import FakeParser
 
 
 class TestTextProcessorDisambiguation(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_parser = Mock()
-        self.text_processor = TextProcessor(self.mock_parser)
+        self.text_processor = TextProcessor(FakeParser())
     
     def create_morph_entry(self, lemma, definition, pos=PartOfSpeech.VERB, 
                           features=None, morph_classes=None):
@@ -109,6 +109,15 @@ class TestTextProcessorDisambiguation(unittest.TestCase):
         # Should use the unnumbered form
         self.assertEqual(result[0].lemma, "λέγω")
     
+    def test_collapse_redundant_entries_does_not_mutate_input(self):
+        """Test that collapsing strips lemma numbers on copies, leaving parser entries intact."""
+        entries = [self.create_morph_entry("λέγω1", "to say")]
+        
+        result = self.text_processor._collapse_redundant_entries(entries)
+        
+        self.assertEqual(result[0].lemma, "λέγω")
+        self.assertEqual(entries[0].lemma, "λέγω1")
+    
     @patch('builtins.input', return_value='')  # Simulate user pressing Enter (select all)
     def test_disambiguate_entries_redundant_automatically_collapsed(self, mock_input):
         """Test that redundant entries are automatically collapsed without user prompt."""
@@ -0,0 +1,153 @@
+"""Test TextProcessor.process_words: its parsing fallbacks, result keys and warnings."""
+import random
+import zlib
+from dataclasses import replace
+
+import pytest
+
+from morph import MorphEntry
+from morph.part_of_speech import PartOfSpeech
+from vocab.text_processor import TextProcessor, _normalize_apostrophes
+from tests.shared_parser import FakeParser
+
+
+def create_entry(lemma, definition="test definition"):
+    """Helper function to create a MorphEntry for testing."""
+    return MorphEntry(
+        original=lemma,
+        part_of_speech=PartOfSpeech.NOUN,
+        lemma=lemma,
+        features=frozenset(),
+        morph_classes=frozenset(),
+        short_definition=definition
+    )
+
+
+class RecordingParser(FakeParser):
+    """Parses only the (word, ignore_case, ignore_accent) combinations it is given, and
+    records each parse_words call as (words, ignore_case, ignore_accent)."""
+
+    def __init__(self, known):
+        self.known = known
+        self.calls = []
+
+    def parse_word(self, word, ignore_case=False, ignore_accent=False, **kwargs):
+        return list(self.known.get((word, ignore_case, ignore_accent), []))
+
+    def parse_words(self, words, ignore_case=False, ignore_accent=False, **kwargs):
+        words = list(words)
+        self.calls.append((words, ignore_case, ignore_accent))
+        return {word: self.parse_word(word, ignore_case, ignore_accent) for word in words}
+
+
+@pytest.fixture
+def proper_names(monkeypatch):
+    """Give each test its own PROPER_NAMES, so recorded names don't leak between tests."""
+    names = set()
+    monkeypatch.setattr(TextProcessor, "PROPER_NAMES", names)
+    return names
+
+
+def test_fallback_order(proper_names):
+    """Test that each fallback only sees the words the earlier attempts could not parse."""
+    parser = RecordingParser({
+        ("λέγει", False, False): [create_entry("λέγω")],
+        ("ΛΟΓΟΣ", True, False): [create_entry("λόγος")],
+        ("λογον", True, True): [create_entry("λόγος")],
+        ("Σωκρατης", True, True): [create_entry("Σωκράτης")],
+    })
+    words = ["λέγει", "ΛΟΓΟΣ", "λογον", "σωκρατης", "ξξξ"]
+
+    results = TextProcessor(parser).process_words(words, interactive=False)
+
+    assert parser.calls == [
+        (words, False, False),
+        (["ΛΟΓΟΣ", "λογον", "σωκρατης", "ξξξ"], True, False),
+        (["λογον", "σωκρατης", "ξξξ"], True, True),
+        (["Σωκρατης", "Ξξξ"], True, True),
+    ]
+    assert {word: [entry.lemma for entry in entries] for word, entries in results.items()} == {
+        "λέγει": ["λέγω"], "ΛΟΓΟΣ": ["λόγος"], "λογον": ["λόγος"], "σωκρατης": ["Σωκράτης"], "ξξξ": []}
+
+
+def test_results_keyed_by_original_spelling(proper_names):
+    """Test that words are parsed with normalized apostrophes but keyed as given."""
+    parser = RecordingParser({("δ᾽", False, False): [create_entry("δέ")]})
+
+    results = TextProcessor(parser).process_words(["δʼ", "δ`"], interactive=False)
+
+    # Both spellings normalize to the same word, which is parsed once
+    assert parser.calls == [(["δ᾽"], False, False)]
+    assert list(results) == ["δʼ", "δ`"]
+    assert [entry.lemma for entry in results["δʼ"]] == ["δέ"]
+    assert [entry.lemma for entry in results["δ`"]] == ["δέ"]
+
+
+def test_unparsed_word_warnings(capsys, proper_names):
+    """Test the warnings for unparsed words, and that capitalized ones are recorded as proper names."""
+    results = TextProcessor(RecordingParser({})).process_words(["ξξξ", "Ξανθίας"], interactive=False)
+
+    assert results == {"ξξξ": [], "Ξανθίας": []}
+    assert capsys.readouterr().out.splitlines() == [
+        "Warning: Could not parse word 'ξξξ'",
+        "Warning: COULD NOT PARSE 'Ξανθίας', LIKELY PROPER NAME",
+    ]
+    assert proper_names == {"Ξανθίας"}
+
+
+class HashingParser(FakeParser):
+    """Parses about half of all (word, ignore_case, ignore_accent) combinations, chosen by hash,
+    into one or two numbered lemmas, so results are deterministic but varied."""
+
+    def parse_word(self, word, ignore_case=False, ignore_accent=False, **kwargs):
+        h = zlib.crc32(f"{word}|{ignore_case}|{ignore_accent}".encode("utf-8"))
+        if h % 2:
+            return []
+        return [create_entry(f"{word}{n}", f"def {h % 3}") for n in range(1, 2 + (h >> 8) % 2)]
+
+
+def _process_word_one_at_a_time(processor, word):
+    """The fallbacks of the per-word process_word that process_words replaced, for interactive=False."""
+    parser = processor.morph_parser
+    original_word = word
+    word = _normalize_apostrophes(word)
+    for ignore_case, ignore_accent in ((False, False), (True, False), (True, True)):
+        entries = parser.parse_word(word, ignore_case=ignore_case, ignore_accent=ignore_accent)
+        if entries:
+            return processor._collapse_redundant_entries(entries)
+    if word.islower():
+        entries = parser.parse_word(word[0].upper() + word[1:], ignore_case=True, ignore_accent=True)
+        if entries:
+            return processor._collapse_redundant_entries(entries)
+    if word != original_word and word.startswith('ἐξ'):
+        root_entries = parser.parse_word(word[2:])
+        if root_entries:
+            return [entry if entry.lemma.startswith('ἐξ') else replace(entry, lemma='ἐξ' + entry.lemma)
+                    for entry in processor._collapse_redundant_entries(root_entries)]
+    if word and word[0].isupper() and word.isalpha():
+        print(f"Warning: COULD NOT PARSE '{word}', LIKELY PROPER NAME")
+        processor.PROPER_NAMES.add(word)
+    else:
+        print(f"Warning: Could not parse word '{word}'")
+    return []
+
+
+def test_matches_one_word_at_a_time(capsys, proper_names):
+    """Test that process_words gives the same entries, warnings and proper names as parsing
+    each word on its own, over random word lists."""
+    processor = TextProcessor(HashingParser())
+    pieces = ["ἐξ", "λ", "Λ", "ό", "ο", "γ", "ς", "ʼ", "`", "᾽"]
+    rng = random.Random(0)
+
+    for _ in range(300):
+        words = ["".join(rng.choices(pieces, k=rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+
+        expected = {word: _process_word_one_at_a_time(processor, word) for word in dict.fromkeys(words)}
+        expected_output = capsys.readouterr().out
+        expected_names = set(proper_names)
+        proper_names.clear()
+
+        assert processor.process_words(words, interactive=False) == expected
+        assert capsys.readouterr().out == expected_output
+        assert proper_names == expected_names
+        proper_names.clear()
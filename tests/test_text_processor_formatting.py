@@ -1,30 +1,30 @@
-import os
 import pytest
-from morph import MorphParser
 from vocab.vocab_generator import VocabGenerator
-from vocab.text_processor import TextProcessor
 from morph.part_of_speech import PartOfSpeech
 from morph.features import Feature
 from morph.morph_class import MorphClass
 
-@pytest.fixture
-def morph_parser():
-    """Create a MorphParser instance for testing."""
-    current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    morpheus_root = os.path.join(current_dir, "morpheus")
-    cruncher = os.path.join(morpheus_root, "bin", "cruncher")
-    stemlib = os.path.join(morpheus_root, "stemlib")
-    return MorphParser(cruncher_path=cruncher, stemlib_path=stemlib)
+# Keep this module on one xdist worker so its batched prewarm runs only once
+pytestmark = pytest.mark.xdist_group("formatting")
 
-@pytest.fixture
-def text_processor(morph_parser):
-    """Create a TextProcessor instance for testing."""
-    return TextProcessor(morph_parser)
+# Every word the tests below parse
+_TEST_WORDS = ('ἐπίορκος', 'εὐδαίμων', 'ἀγαθός', 'ἀληθής', 'πολύς', 'μέγας', 'ἄνθρωπος', 'πόλις',
+               'καλός', 'σοφός', 'πόσος', 'ἄλλος', 'πᾶς')
 
-@pytest.fixture
-def vocab_generator(morph_parser):
+@pytest.fixture(scope="module")
+def prewarmed_parser(morph_parser):
+    """Parse all the test words with one cruncher run, so the tests that parse hit the parser's cache.
+    
+    Requested only by the fixtures and classes that parse, so tests that never touch
+    morpheus don't need it built.
+    """
+    morph_parser.parse_words(_TEST_WORDS)
+    return morph_parser
+
+@pytest.fixture(scope="module")
+def vocab_generator(prewarmed_parser):
     """Create a VocabGenerator instance for testing."""
-    return VocabGenerator(morph_parser, latex_output=True)
+    return VocabGenerator(prewarmed_parser, latex_output=True)
 
 class TestAdjectiveFormatting:
     """Test cases for adjective morphological formatting."""
@@ -97,6 +97,7 @@ class TestAdjectiveFormatting:
         assert entry.morphology == "μέγας, μεγάλη, μέγα"
         assert entry.format_latex_entry() == "\\vocabentry{μέγας, μεγάλη, μέγα}{big, great}"
 
+@pytest.mark.usefixtures("prewarmed_parser")
 class TestMorphologicalClassDetection:
     """Test cases for proper detection of morphological classes."""
     
@@ -135,9 +136,8 @@ class TestMorphologicalClassDetection:
         assert len(morph_entries) > 0
         
         # Find the adjective entry
-        adj_entry = next((entry for entry in morph_entries 
-                         if MorphClass.is_adjective(entry.morph_classes)), None)
-        assert adj_entry is not None
+        assert morph_entries.adjective_entries
+        adj_entry = morph_entries.adjective_entries[0]
         assert MorphClass.ADJ_2_1_2 in adj_entry.morph_classes
         
         # Test the formatting logic
@@ -1,346 +1,202 @@
-import unittest
-import os
-import sys
-from unittest.mock import Mock
+"""Test morphological formatting in TextProcessor to ensure adjective patterns don't duplicate masculine forms."""
+import pytest
 
-# Add the parent directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from morph import MorphParser, MorphEntry
+from morph import MorphEntry
 from morph.features import Feature
 from morph.morph_class import MorphClass
 from morph.part_of_speech import PartOfSpeech
 from vocab.text_processor import TextProcessor
-from vocab.vocab_entry import VocabEntry
+from tests.shared_parser import FakeParser
 
 
-class TestTextProcessorMorphology(unittest.TestCase):
-    """Test morphological formatting in TextProcessor to ensure adjective patterns don't duplicate masculine forms."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Mock the MorphParser since we're testing formatting logic, not parsing
-        self.mock_parser = Mock(spec=MorphParser)
-        self.processor = TextProcessor(self.mock_parser)
-    
-    def create_mock_entry(self, lemma, part_of_speech, features, morph_classes, definition="test definition"):
-        """Helper method to create a mock MorphEntry for testing."""
-        entry = Mock(spec=MorphEntry)
-        entry.lemma = lemma
-        entry.part_of_speech = part_of_speech
-        entry.features = features
-        entry.morph_classes = morph_classes
-        entry.short_definition = definition
-        return entry
-    
-    def test_as_asa_an_pattern(self):
-        """Test AS_ASA_AN morphological pattern (ἁπαξάπας type)."""
-        entry = self.create_mock_entry(
-            lemma="ἁπαξάπας",
-            part_of_speech=PartOfSpeech.NOUN,
-            features={Feature.MASCULINE, Feature.SINGULAR},
-            morph_classes={MorphClass.AS_ASA_AN},
-            definition="all at once"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ἁπαξάπας")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")  # Should be reclassified as adjective
-        self.assertEqual(vocab_entry.morphology, "ασα, αν")  # Should not duplicate masculine
-        self.assertEqual(vocab_entry.definition, "all at once")
-    
-    def test_adj_2_1_2_pattern_alpha_feminine(self):
-        """Test ADJ_2_1_2 morphological pattern with alpha feminine (ἀγαθός type)."""
-        entry = self.create_mock_entry(
-            lemma="ἀγαθός",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE, Feature.FEMININE},
-            morph_classes={MorphClass.ADJ_2_1_2},
-            definition="good"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ἀγαθός")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "ή, όν")  # Should not duplicate masculine (final syllable accented)
-        self.assertEqual(vocab_entry.definition, "good")
-    
-    def test_adj_2_1_2_pattern_default_case(self):
-        """Test ADJ_2_1_2 morphological pattern with default alpha feminine case."""
-        entry = self.create_mock_entry(
-            lemma="μικρός",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE, Feature.FEMININE},
-            morph_classes={MorphClass.ADJ_2_1_2},
-            definition="small"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "μικρός")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "ή, όν")  # Should use eta feminine and not duplicate masculine (final syllable accented)
-        self.assertEqual(vocab_entry.definition, "small")
-    
-    def test_adj_3_3_pattern(self):
-        """Test ADJ_3_3 morphological pattern (ἀληθής type)."""
-        entry = self.create_mock_entry(
-            lemma="ἀληθής",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE},
-            morph_classes={MorphClass.ADJ_3_3},
-            definition="true"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ἀληθής")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "ές")  # Should not duplicate masculine
-        self.assertEqual(vocab_entry.definition, "true")
-    
-    def test_us_eia_u_pattern(self):
-        """Test US_EIA_U morphological pattern (γλυκύς type)."""
-        entry = self.create_mock_entry(
-            lemma="γλυκύς",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE, Feature.FEMININE},
-            morph_classes={MorphClass.US_EIA_U},
-            definition="sweet"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "γλυκύς")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "εῖα, ύ")  # Should not duplicate masculine
-        self.assertEqual(vocab_entry.definition, "sweet")
-    
-    def test_hedys_pattern(self):
-        """Test ἡδύς (sweet) follows US_EIA_U morphological pattern correctly."""
-        entry = self.create_mock_entry(
-            lemma="ἡδύς",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE, Feature.FEMININE},
-            morph_classes={MorphClass.US_EIA_U},
-            definition="sweet"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ἡδύς")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "εῖα, ύ")  # Should be εῖα, ύ not ή, όν
-        self.assertEqual(vocab_entry.definition, "sweet")
-        self.assertEqual(vocab_entry.format_latex_entry(), "\\vocabentry{ἡδύς, εῖα, ύ}{sweet}")
-    
-    def test_hedys_fallback_pattern(self):
-        """Test ἡδύς behavior without explicit US_EIA_U classification - treated as noun."""
-        entry = self.create_mock_entry(
-            lemma="ἡδύς",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE, Feature.FEMININE},
-            morph_classes=set(),  # No specific morphological class - test fallback logic
-            definition="sweet"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ἡδύς")
-        self.assertEqual(vocab_entry.part_of_speech, "noun")  # Without adjective morph class, treated as noun
-        self.assertEqual(vocab_entry.morphology, "ὁ")  # Treated as masculine noun without adjective classification
-        self.assertEqual(vocab_entry.definition, "sweet")
-        self.assertEqual(vocab_entry.format_latex_entry(), "\\vocabentry{ἡδύς, ὁ}{sweet}")
-    
-    def test_wn_on_pattern(self):
-        """Test WN_ON morphological pattern (σώφρων type) - two-ending adjective."""
-        entry = self.create_mock_entry(
-            lemma="σώφρων",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE},
-            morph_classes={MorphClass.WN_ON},
-            definition="of sound mind"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "σώφρων")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "ον")  # Two-ending: just neuter
-        self.assertEqual(vocab_entry.definition, "of sound mind")
-    
-    def test_adj_2_2_pattern(self):
-        """Test ADJ_2_2 morphological pattern - two-ending adjective."""
-        entry = self.create_mock_entry(
-            lemma="βάρβαρος",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE},
-            morph_classes={MorphClass.ADJ_2_2},
-            definition="foreign"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "βάρβαρος")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "ον")  # Two-ending: just neuter
-        self.assertEqual(vocab_entry.definition, "foreign")
-    
-    def test_hubris_third_declension_noun(self):
-        """Test ὕβρις (hubris) as a third declension noun."""
-        entry = self.create_mock_entry(
-            lemma="ὕβρις",
-            part_of_speech=PartOfSpeech.NOUN,
-            features={Feature.FEMININE, Feature.SINGULAR, Feature.NOMINATIVE},
-            morph_classes={MorphClass.THIRD_DECLENSION, MorphClass.IS_EWS},  # Third declension with -ις, -εως pattern
-            definition="hubris, wanton violence"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ὕβρις")
-        self.assertEqual(vocab_entry.part_of_speech, "noun")
-        self.assertEqual(vocab_entry.morphology, "εως, ἡ")  # Third declension genitive pattern
-        self.assertEqual(vocab_entry.definition, "hubris, wanton violence")
-    
-    def test_real_word_kalos(self):
-        """Test real word καλός with actual morphological data from morpheus."""
-        entry = self.create_mock_entry(
-            lemma="καλός",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.NOMINATIVE, Feature.SINGULAR, Feature.MASCULINE},
-            morph_classes={MorphClass.ADJ_2_1_2},  # Actual morphological class returned by morpheus
-            definition="beautiful"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "καλός")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")  # Should be reclassified due to adjective morph class
-        self.assertEqual(vocab_entry.morphology, "ή, όν")  # Should not duplicate masculine from lemma (eta feminine because λ ≠ ε,ι,ρ)
-        self.assertEqual(vocab_entry.definition, "beautiful")
-    
-    def test_real_word_eugenes(self):
-        """Test real word εὐγενής with actual morphological data from morpheus."""
-        entry = self.create_mock_entry(
-            lemma="εὐγενής",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASC_FEM, Feature.SINGULAR, Feature.NOMINATIVE},
-            morph_classes={MorphClass.ADJ_3_3},  # Actual morphological class returned by morpheus
-            definition="well-born, of noble race, of high descent"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "εὐγενής")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")  # Should be reclassified due to adjective morph class
-        self.assertEqual(vocab_entry.morphology, "ές")  # Should not duplicate masculine from lemma
-        self.assertEqual(vocab_entry.definition, "well-born, of noble race, of high descent")
-    
-    def test_real_word_tachus(self):
-        """Test real word ταχύς with actual morphological data from morpheus."""
-        entry = self.create_mock_entry(
-            lemma="ταχύς",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.SINGULAR, Feature.MASCULINE, Feature.NOMINATIVE},
-            morph_classes={MorphClass.US_EIA_U},  # Actual morphological class returned by morpheus
-            definition="quick, swift, fleet"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ταχύς")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")  # Should be reclassified due to adjective morph class
-        self.assertEqual(vocab_entry.morphology, "εῖα, ύ")  # Should not duplicate masculine from lemma
-        self.assertEqual(vocab_entry.definition, "quick, swift, fleet")
-    
-    def test_fallback_pattern_wn_ending(self):
-        """Test fallback patterns for -ων endings."""
-        entry = self.create_mock_entry(
-            lemma="χαρίεις",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE},
-            morph_classes={MorphClass.AS_ASA_AN},  # Should use fallback patterns
-            definition="graceful"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "χαρίεις")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "ασα, αν")  # Should use fallback
-        self.assertEqual(vocab_entry.definition, "graceful")
-    
-    def test_irregular_adjectives_preserved(self):
-        """Test that irregular adjectives preserve their special patterns."""
-        entry = self.create_mock_entry(
-            lemma="πολύς",
-            part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
-            features={Feature.MASCULINE},
-            morph_classes={MorphClass.US_EIA_U},  # Would normally use regular pattern
-            definition="much, many"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "πολύς")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")
-        self.assertEqual(vocab_entry.morphology, "πολύς, πολλή, πολύ")  # Should use irregular pattern
-        self.assertEqual(vocab_entry.definition, "much, many")
-    
-    def test_non_adjective_unaffected(self):
-        """Test that non-adjectives are not affected by the formatting changes."""
-        entry = self.create_mock_entry(
-            lemma="ἀνήρ",
-            part_of_speech=PartOfSpeech.NOUN,
-            features={Feature.MASCULINE, Feature.SINGULAR, Feature.NOMINATIVE},
-            morph_classes={MorphClass.THIRD_DECLENSION},  # Not an adjective class
-            definition="man"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "ἀνήρ")
-        self.assertEqual(vocab_entry.part_of_speech, "noun")
-        self.assertEqual(vocab_entry.morphology, "ἀνδρός, ὁ")  # Should use noun pattern
-        self.assertEqual(vocab_entry.definition, "man")
-    
-    def test_adverb_formatting(self):
-        """Test that adverbs get the correct (adv.) marker."""
-        entry = self.create_mock_entry(
-            lemma="καλῶς",
-            part_of_speech=PartOfSpeech.ADVERB,
-            features={Feature.ADVERB},
-            morph_classes=set(),
-            definition="well"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "καλῶς")
-        self.assertEqual(vocab_entry.part_of_speech, "adverb")
-        self.assertEqual(vocab_entry.morphology, "(adv.)")
-        self.assertEqual(vocab_entry.definition, "well")
-    
-    def test_adjective_reclassification(self):
-        """Test that morphological adjective classes override the part_of_speech classification."""
-        entry = self.create_mock_entry(
-            lemma="κακός",
-            part_of_speech=PartOfSpeech.NOUN,  # Morpheus often classifies adjectives as NOUN
-            features={Feature.MASCULINE},
-            morph_classes={MorphClass.ADJ_2_1_2},  # But morph class indicates it's an adjective
-            definition="bad"
-        )
-        
-        vocab_entry = self.processor.vocab_entry_service.create_vocab_entry(entry)
-        
-        self.assertEqual(vocab_entry.lemma, "κακός")
-        self.assertEqual(vocab_entry.part_of_speech, "adjective")  # Should be reclassified
-        self.assertEqual(vocab_entry.morphology, "ή, όν")  # Should use adjective pattern (eta feminine because κ ≠ ε,ι,ρ)
-        self.assertEqual(vocab_entry.definition, "bad")
-
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+@pytest.fixture(scope="module")
+def processor():
+    """Provide a TextProcessor over a fake parser, since we're testing formatting logic, not parsing.
+    
+    One processor serves the whole module, so its VocabEntry cache is shared by every case.
+    That is safe because the cache key covers every field the formatting reads, so a cached
+    entry is the same one a fresh call would build.
+    """
+    return TextProcessor(FakeParser())
+
+
+@pytest.fixture(scope="module")
+def create_vocab_entry(processor):
+    """The processor's create_vocab_entry, with the attribute chain looked up once for the module."""
+    return processor.vocab_entry_service.create_vocab_entry
+
+
+def create_entry(lemma, part_of_speech, features, morph_classes, definition="test definition"):
+    """Helper function to create a MorphEntry for testing.
+
+    A real (frozen, slotted) entry is cheaper to build and read than a Mock(spec=MorphEntry).
+    """
+    return MorphEntry(
+        original=lemma,
+        part_of_speech=part_of_speech,
+        lemma=lemma,
+        features=features,
+        morph_classes=morph_classes,
+        short_definition=definition
+    )
+
+
+def _fields(vocab_entry):
+    """The fields these tests check, as one tuple so a failure shows every difference at once."""
+    return (vocab_entry.lemma, vocab_entry.part_of_speech, vocab_entry.morphology, vocab_entry.definition)
+
+
+# Feature and morph class combinations used below, built once at import rather than per test
+_ADVERB = frozenset({Feature.ADVERB})
+_FEM_SG_NOM = frozenset({Feature.FEMININE, Feature.SINGULAR, Feature.NOMINATIVE})
+_MASC = frozenset({Feature.MASCULINE})
+_MASC_FEM = frozenset({Feature.MASCULINE, Feature.FEMININE})
+_MASC_FEM_SG_NOM = frozenset({Feature.MASC_FEM, Feature.SINGULAR, Feature.NOMINATIVE})
+_MASC_SG = frozenset({Feature.MASCULINE, Feature.SINGULAR})
+_MASC_SG_NOM = frozenset({Feature.MASCULINE, Feature.SINGULAR, Feature.NOMINATIVE})
+_ADJ_2_1_2 = frozenset({MorphClass.ADJ_2_1_2})
+_ADJ_2_2 = frozenset({MorphClass.ADJ_2_2})
+_ADJ_3_3 = frozenset({MorphClass.ADJ_3_3})
+_AS_ASA_AN = frozenset({MorphClass.AS_ASA_AN})
+_THIRD_DECLENSION = frozenset({MorphClass.THIRD_DECLENSION})
+_THIRD_DECLENSION_IS_EWS = frozenset({MorphClass.THIRD_DECLENSION, MorphClass.IS_EWS})
+_US_EIA_U = frozenset({MorphClass.US_EIA_U})
+_WN_ON = frozenset({MorphClass.WN_ON})
+_NO_CLASSES = frozenset()
+
+
+# Adjectives are classified as NOUN in morpheus; their morph classes should reclassify them
+# as adjectives, and the morphology should not duplicate the masculine form in the lemma.
+# Each case is (lemma, features, morph_classes, definition, expected_morphology).
+ADJ_CASES = [
+    pytest.param("ἁπαξάπας", _MASC_SG, _AS_ASA_AN,
+                 "all at once", "ασα, αν", id="as_asa_an_pattern"),
+    pytest.param("ἀγαθός", _MASC_FEM, _ADJ_2_1_2,
+                 "good", "ή, όν", id="adj_2_1_2_pattern_alpha_feminine"),  # Final syllable accented
+    pytest.param("μικρός", _MASC_FEM, _ADJ_2_1_2,
+                 "small", "ή, όν", id="adj_2_1_2_pattern_default_case"),  # Eta feminine, final syllable accented
+    pytest.param("ἀληθής", _MASC, _ADJ_3_3,
+                 "true", "ές", id="adj_3_3_pattern"),
+    pytest.param("γλυκύς", _MASC_FEM, _US_EIA_U,
+                 "sweet", "εῖα, ύ", id="us_eia_u_pattern"),
+    pytest.param("σώφρων", _MASC, _WN_ON,
+                 "of sound mind", "ον", id="wn_on_pattern"),  # Two-ending: just neuter
+    pytest.param("βάρβαρος", _MASC, _ADJ_2_2,
+                 "foreign", "ον", id="adj_2_2_pattern"),  # Two-ending: just neuter
+    # Real words with the morphological data morpheus actually returns
+    pytest.param("καλός", _MASC_SG_NOM, _ADJ_2_1_2,
+                 "beautiful", "ή, όν", id="real_word_kalos"),  # Eta feminine because λ ≠ ε,ι,ρ
+    pytest.param("εὐγενής", _MASC_FEM_SG_NOM, _ADJ_3_3,
+                 "well-born, of noble race, of high descent", "ές", id="real_word_eugenes"),
+    pytest.param("ταχύς", _MASC_SG_NOM, _US_EIA_U,
+                 "quick, swift, fleet", "εῖα, ύ", id="real_word_tachus"),
+    pytest.param("χαρίεις", _MASC, _AS_ASA_AN,
+                 "graceful", "ασα, αν", id="fallback_pattern_wn_ending"),
+    # Irregular adjectives keep their special pattern even with a regular morph class
+    pytest.param("πολύς", _MASC, _US_EIA_U,
+                 "much, many", "πολύς, πολλή, πολύ", id="irregular_adjectives_preserved"),
+    # Morph class overrides the NOUN classification; eta feminine because κ ≠ ε,ι,ρ
+    pytest.param("κακός", _MASC, _ADJ_2_1_2,
+                 "bad", "ή, όν", id="adjective_reclassification"),
+]
+
+
+@pytest.mark.parametrize("lemma,features,morph_classes,definition,expected_morphology", ADJ_CASES)
+def test_adjective_pattern(create_vocab_entry, lemma, features, morph_classes, definition, expected_morphology):
+    """Test that adjective morph classes give the adjective's endings without the masculine form."""
+    entry = create_entry(lemma, PartOfSpeech.NOUN, features, morph_classes, definition)
+
+    vocab_entry = create_vocab_entry(entry)
+
+    # Should be reclassified as adjective
+    assert _fields(vocab_entry) == (lemma, "adjective", expected_morphology, definition)
+
+
+def test_hedys_pattern(create_vocab_entry):
+    """Test ἡδύς (sweet) follows US_EIA_U morphological pattern correctly."""
+    entry = create_entry(
+        lemma="ἡδύς",
+        part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
+        features=_MASC_FEM,
+        morph_classes=_US_EIA_U,
+        definition="sweet"
+    )
+
+    vocab_entry = create_vocab_entry(entry)
+
+    # Should be εῖα, ύ not ή, όν
+    assert _fields(vocab_entry) == ("ἡδύς", "adjective", "εῖα, ύ", "sweet")
+    assert vocab_entry.format_latex_entry() == "\\vocabentry{ἡδύς, εῖα, ύ}{sweet}"
+
+
+def test_hedys_fallback_pattern(create_vocab_entry):
+    """Test ἡδύς behavior without explicit US_EIA_U classification - treated as noun."""
+    entry = create_entry(
+        lemma="ἡδύς",
+        part_of_speech=PartOfSpeech.NOUN,  # Adjectives are classified as NOUN in morpheus
+        features=_MASC_FEM,
+        morph_classes=_NO_CLASSES,  # No specific morphological class - test fallback logic
+        definition="sweet"
+    )
+
+    vocab_entry = create_vocab_entry(entry)
+
+    # Without adjective morph class, treated as masculine noun
+    assert _fields(vocab_entry) == ("ἡδύς", "noun", "ὁ", "sweet")
+    assert vocab_entry.format_latex_entry() == "\\vocabentry{ἡδύς, ὁ}{sweet}"
+
+
+def test_hubris_third_declension_noun(create_vocab_entry):
+    """Test ὕβρις (hubris) as a third declension noun."""
+    entry = create_entry(
+        lemma="ὕβρις",
+        part_of_speech=PartOfSpeech.NOUN,
+        features=_FEM_SG_NOM,
+        morph_classes=_THIRD_DECLENSION_IS_EWS,  # Third declension with -ις, -εως pattern
+        definition="hubris, wanton violence"
+    )
+
+    vocab_entry = create_vocab_entry(entry)
+
+    # Third declension genitive pattern
+    assert _fields(vocab_entry) == ("ὕβρις", "noun", "εως, ἡ", "hubris, wanton violence")
+
+
+def test_non_adjective_unaffected(create_vocab_entry):
+    """Test that non-adjectives are not affected by the formatting changes."""
+    entry = create_entry(
+        lemma="ἀνήρ",
+        part_of_speech=PartOfSpeech.NOUN,
+        features=_MASC_SG_NOM,
+        morph_classes=_THIRD_DECLENSION,  # Not an adjective class
+        definition="man"
+    )
+
+    vocab_entry = create_vocab_entry(entry)
+
+    # Should use noun pattern
+    assert _fields(vocab_entry) == ("ἀνήρ", "noun", "ἀνδρός, ὁ", "man")
+
+
+def test_adverb_formatting(create_vocab_entry):
+    """Test that adverbs get the correct (adv.) marker."""
+    entry = create_entry(
+        lemma="καλῶς",
+        part_of_speech=PartOfSpeech.ADVERB,
+        features=_ADVERB,
+        morph_classes=_NO_CLASSES,
+        definition="well"
+    )
+
+    vocab_entry = create_vocab_entry(entry)
+
+    assert _fields(vocab_entry) == ("καλῶς", "adverb", "(adv.)", "well")
+
+
+def test_repeated_analysis_reuses_vocab_entry(create_vocab_entry):
+    """Test that two forms with the same analysis share one VocabEntry."""
+    first = create_entry("κακός", PartOfSpeech.NOUN, _MASC, _ADJ_2_1_2, "bad")
+    second = MorphEntry(original="κακοῦ", part_of_speech=PartOfSpeech.NOUN, lemma="κακός",
+                        features=_MASC, morph_classes=_ADJ_2_1_2, short_definition="bad")
+
+    assert create_vocab_entry(second) is create_vocab_entry(first)
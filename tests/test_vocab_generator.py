@@ -1,20 +1,14 @@
-import os
+import logging
 import pytest
-from morph import MorphParser
+from vocab.text_processor import TextProcessor
 from vocab.vocab_generator import VocabGenerator
+from tests.shared_parser import FakeParser
 from morph.part_of_speech import PartOfSpeech
 from morph.features import Feature
 
-@pytest.fixture
-def morph_parser():
-    """Create a MorphParser instance for testing."""
-    current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    morpheus_root = os.path.join(current_dir, "morpheus")
-    cruncher = os.path.join(morpheus_root, "bin", "cruncher")
-    stemlib = os.path.join(morpheus_root, "stemlib")
-    return MorphParser(cruncher_path=cruncher, stemlib_path=stemlib)
+log = logging.getLogger(__name__)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vocab_generator(morph_parser):
     """Create a VocabGenerator instance for testing."""
     return VocabGenerator(morph_parser)
@@ -41,10 +35,37 @@ def test_duplicate_word_handling(vocab_generator):
     assert len(entries) == 1
     assert "λέγω:" in vocab_generator.format_vocab_list(entries)
     
-def test_word_extraction(vocab_generator):
+def test_text_parsed_in_one_batch(vocab_generator, monkeypatch):
+    """Test that a text's words are parsed together, not with one cruncher run per word."""
+    parser = vocab_generator.text_processor.morph_parser
+    # Start from an empty parse cache, so earlier tests can't leave nothing to parse
+    monkeypatch.setattr(parser, "_cache", {})
+    run_cruncher_batch = parser._run_cruncher_batch
+    parse_with_morpheus = parser._parse_with_morpheus
+    batch_runs = []
+    single_word_runs = []
+    
+    def record_batch(words, *args, **kwargs):
+        batch_runs.append(words)
+        return run_cruncher_batch(words, *args, **kwargs)
+    
+    def record_run(word, *args, **kwargs):
+        single_word_runs.append(word)
+        return parse_with_morpheus(word, *args, **kwargs)
+    
+    monkeypatch.setattr(parser, "_run_cruncher_batch", record_batch)
+    monkeypatch.setattr(parser, "_parse_with_morpheus", record_run)
+    vocab_generator.generate_vocab_list("ὁ ἄνθρωπος τὸν λόγον λέγει", interactive=False)
+    # The first batch holds all five words
+    assert batch_runs and len(batch_runs[0]) == 5
+    assert single_word_runs == []
+    
+def test_word_extraction():
     """Test that words are correctly extracted from text with punctuation."""
+    # Extraction never consults the parser, so this test needs no cruncher
+    text_processor = TextProcessor(FakeParser())
     text = "ὁ ἄνθρωπος, καὶ ὁ λόγος."
-    words = vocab_generator.text_processor.extract_words(text)
+    words = text_processor.extract_words(text)
     
     expected = {"ὁ", "ἄνθρωπος", "καὶ", "λόγος"}
     assert set(words) == expected
@@ -56,25 +77,30 @@ def test_format_morphology(vocab_generator):
     entries = vocab_generator.generate_vocab_list(text, interactive=False)
     formatted = vocab_generator.format_vocab_list(entries)
     
-    # Print formatted output for debugging
-    print(f"DEBUG: Formatted output:\n{formatted}")
+    # Log formatted output for debugging (shown with --log-level=DEBUG)
+    log.debug("Formatted output:\n%s", formatted)
+    
+    # Split once into sets, so each check below is a lookup rather than a scan of the output
+    headwords = {line.split(": ", 1)[0] for line in formatted.splitlines()}
+    lemmas = {entry.lemma for entry in entries}
+    morphologies = {entry.morphology for entry in entries}
     
     # Check for noun with masculine article format
-    assert "ἄνθρωπος, ὁ:" in formatted
+    assert "ἄνθρωπος, ὁ" in headwords
     
     # Check for various possible formats for σῶμα
-    possible_formats = ["σῶμα, σῶμα, ματος, τό:", "σῶμα, τό:", "σῶμα, ματος, τό:"]
-    assert any(fmt in formatted for fmt in possible_formats), f"Expected one of {possible_formats} for σῶμα"
+    possible_formats = {"σῶμα, σῶμα, ματος, τό", "σῶμα, τό", "σῶμα, ματος, τό"}
+    assert not headwords.isdisjoint(possible_formats), f"Expected one of {possible_formats} for σῶμα"
     
     # Check for adjective format
-    assert "καλός" in formatted  # Looks like it's parsed as a noun rather than adjective
+    assert "καλός" in lemmas  # Looks like it's parsed as a noun rather than adjective
     
     # For adverb format
-    assert "(adv.)" in formatted
+    assert "(adv.)" in morphologies
     
-    # Check for other entries
+    # Check for other entries; morpheus's lemma for μηνί varies, so this one stays a substring check
     assert "μείς" in formatted or "μην" in formatted
-    assert "πόλις" in formatted
+    assert "πόλις" in lemmas
 
 def test_apostrophe_handling(vocab_generator):
     """Test that words with apostrophes are handled correctly."""
@@ -128,11 +154,9 @@ def test_greek_alphabetization(vocab_generator):
     allotrios_pos = next(i for i, lemma in enumerate(sorted_lemmas) if lemma == "ἀλλότριος")
     
     # Debug output for troubleshooting
-    print(f"DEBUG: Sorted lemmas: {sorted_lemmas}")
-    print(f"DEBUG: ἄγχω at position {agcho_pos}")
-    print(f"DEBUG: αἱματόω at position {haimatoo_pos}")
-    print(f"DEBUG: αἱματο-σταγής at position {haima_stag_pos}")
-    print(f"DEBUG: ἀλλότριος at position {allotrios_pos}")
+    log.debug("Sorted lemmas: %s", sorted_lemmas)
+    log.debug("ἄγχω at position %d, αἱματόω at %d, αἱματο-σταγής at %d, ἀλλότριος at %d",
+              agcho_pos, haimatoo_pos, haima_stag_pos, allotrios_pos)
     
     # Test the core alphabetization issue: αἱματ- words should come between ἄγχω and ἀλλότριος
     assert agcho_pos < haimatoo_pos, f"ἄγχω (pos {agcho_pos}) should come before αἱματόω (pos {haimatoo_pos})"
@@ -209,8 +233,8 @@ def test_alphabetical_ordering_comprehensive():
     sorted_entries = sorted(entries)
     sorted_words = [entry.lemma for entry in sorted_entries]
     
-    print(f"DEBUG: Original order: {test_words}")
-    print(f"DEBUG: Sorted order: {sorted_words}")
+    log.debug("Original order: %s", test_words)
+    log.debug("Sorted order: %s", sorted_words)
     
     # Test that some key ordering relationships hold
     # Alpha words should come first
@@ -1,11 +1,33 @@
 import re
-from typing import List, Set, Dict
+from collections import defaultdict
+from dataclasses import replace
+from typing import Dict, Iterable, List, Set
 from morph import MorphParser, MorphEntry
 from .vocab_entry_service import VocabEntryService
 from morph.features import Feature
 from morph.morph_class import MorphClass
 from morph.part_of_speech import PartOfSpeech
 
+def _base_lemma(lemma: str) -> str:
+    """Strip the homograph number morpheus appends to some lemmas (e.g. λέγω2 -> λέγω)."""
+    return lemma.rstrip('0123456789')
+
+# Apostrophe characters that cause beta code conversion issues. The modifier letter
+# apostrophe (ʼ) gets converted to ')' instead of "'", so convert it to Greek koronis (᾽),
+# which converts correctly to a single apostrophe.
+_APOSTROPHE_MAPPING = {
+    'ʼ': '᾽',  # modifier letter apostrophe → Greek koronis
+    'ʻ': '᾽',  # modifier letter turned comma → Greek koronis  
+    '`': '᾽',  # grave accent → Greek koronis
+    chr(0x2019): '᾽',  # right single quotation mark → Greek koronis
+}
+
+def _normalize_apostrophes(word: str) -> str:
+    """Replace apostrophe characters that cause beta code conversion issues with koronis."""
+    for bad_apos, good_apos in _APOSTROPHE_MAPPING.items():
+        word = word.replace(bad_apos, good_apos)
+    return word
+
 class TextProcessor:
     # Track proper names we've seen but couldn't parse
     PROPER_NAMES: Set[str] = set()
@@ -54,102 +76,46 @@ class TextProcessor:
                     
         return list(set(words))  # Remove duplicates
         
-    def process_word(self, word: str, interactive: bool = True) -> List[MorphEntry]:
-        """Process a single word, optionally asking for user disambiguation."""
-        original_word = word
+    def process_words(self, words: Iterable[str], interactive: bool = True) -> Dict[str, List[MorphEntry]]:
+        """Process many words, optionally asking for user disambiguation.
         
-        # Normalize apostrophe characters that cause beta code conversion issues
-        # The modifier letter apostrophe (ʼ) gets converted to ')' instead of "'"
-        # So convert it to Greek koronis (᾽) which converts correctly to a single apostrophe
-        apostrophe_mapping = {
-            'ʼ': '᾽',  # modifier letter apostrophe → Greek koronis
-            'ʻ': '᾽',  # modifier letter turned comma → Greek koronis  
-            '`': '᾽',  # grave accent → Greek koronis
-            chr(0x2019): '᾽',  # right single quotation mark → Greek koronis
-        }
+        Each parsing attempt runs cruncher once for all the words still unparsed, rather than
+        once per word, so a whole text costs a handful of cruncher runs.
         
-        for bad_apos, good_apos in apostrophe_mapping.items():
-            word = word.replace(bad_apos, good_apos)
+        Returns:
+            Dict mapping each word, as given, to its entries (empty if it could not be parsed)
+        """
+        normalized = {word: _normalize_apostrophes(word) for word in words}
+        pending = list(dict.fromkeys(normalized.values()))
+        parsed = {}
         
-        # Preprocess words with initial apostrophes (elided forms)
-        apostrophe_chars = ["'", "ʼ", "'", "᾽", "᾿", "ʻ", "`"]
-        if any(word.startswith(a) for a in apostrophe_chars):
-            # Try parsing as is - the parser will handle the elided form
-            pass
+        # First try to parse all words normally, then fallback 1: try with -S flag to ignore
+        # case, then fallback 2: try with -S -n flags to ignore case and accent
+        for ignore_case, ignore_accent in ((False, False), (True, False), (True, True)):
+            if not pending:
+                break
+            results = self.morph_parser.parse_words(pending, ignore_case=ignore_case, ignore_accent=ignore_accent)
+            parsed.update((word, results[word]) for word in pending if results[word])
+            pending = [word for word in pending if word not in parsed]
         
-        # First try to parse all words normally
-        entries = self.morph_parser.parse_word(word)
-        if entries:
-            # Always collapse redundant entries regardless of interactive mode
-            entries = self._collapse_redundant_entries(entries)
-            if len(entries) > 1 and interactive:
-                # Check if there are still multiple unique options after collapsing
-                unique_entries = {}
-                for entry in entries:
-                    base_lemma = re.sub(r'\d+$', '', entry.lemma)
-                    key = (base_lemma, entry.short_definition or "(no definition)")
-                    if key not in unique_entries:
-                        unique_entries[key] = entry
-                
-                if len(unique_entries) > 1:
-                    entries = self._disambiguate_entries(word, entries)
-            return entries
-            
-        # Fallback 1: Try with -S flag to ignore case
-        entries = self.morph_parser.parse_word(word, ignore_case=True)
-        if entries:
-            # Always collapse redundant entries regardless of interactive mode
-            entries = self._collapse_redundant_entries(entries)
-            if len(entries) > 1 and interactive:
-                # Check if there are still multiple unique options after collapsing
-                unique_entries = {}
-                for entry in entries:
-                    base_lemma = re.sub(r'\d+$', '', entry.lemma)
-                    key = (base_lemma, entry.short_definition or "(no definition)")
-                    if key not in unique_entries:
-                        unique_entries[key] = entry
-                
-                if len(unique_entries) > 1:
-                    entries = self._disambiguate_entries(word, entries)
-            return entries
-            
-        # Fallback 2: Try with -S -n flags to ignore case and accent
-        entries = self.morph_parser.parse_word(word, ignore_case=True, ignore_accent=True)
-        if entries:
-            # Always collapse redundant entries regardless of interactive mode
-            entries = self._collapse_redundant_entries(entries)
-            if len(entries) > 1 and interactive:
-                # Check if there are still multiple unique options after collapsing
-                unique_entries = {}
-                for entry in entries:
-                    base_lemma = re.sub(r'\d+$', '', entry.lemma)
-                    key = (base_lemma, entry.short_definition or "(no definition)")
-                    if key not in unique_entries:
-                        unique_entries[key] = entry
-                
-                if len(unique_entries) > 1:
-                    entries = self._disambiguate_entries(word, entries)
-            return entries
-            
         # Fallback 3: Try capitalizing first letter with ignore case and accent flags
-        if word.islower() and len(word) > 0:
-            capitalized = word[0].upper() + word[1:] if len(word) > 1 else word[0].upper()
-            entries = self.morph_parser.parse_word(capitalized, ignore_case=True, ignore_accent=True)
-            if entries:
-                # Always collapse redundant entries regardless of interactive mode
-                entries = self._collapse_redundant_entries(entries)
-                if len(entries) > 1 and interactive:
-                    # Check if there are still multiple unique options after collapsing
-                    unique_entries = {}
-                    for entry in entries:
-                        base_lemma = re.sub(r'\d+$', '', entry.lemma)
-                        key = (base_lemma, entry.short_definition or "(no definition)")
-                        if key not in unique_entries:
-                            unique_entries[key] = entry
-                    
-                    if len(unique_entries) > 1:
-                        entries = self._disambiguate_entries(word, entries)
-                return entries
+        capitalized = {word[0].upper() + word[1:]: word for word in pending if word.islower()}
+        if capitalized:
+            results = self.morph_parser.parse_words(capitalized, ignore_case=True, ignore_accent=True)
+            parsed.update((word, results[capital]) for capital, word in capitalized.items() if results[capital])
+        
+        return {original_word: self._finish_word(original_word, word, parsed.get(word), interactive)
+                for original_word, word in normalized.items()}
+        
+    def process_word(self, word: str, interactive: bool = True) -> List[MorphEntry]:
+        """Process a single word, optionally asking for user disambiguation."""
+        return self.process_words([word], interactive)[word]
+        
+    def _finish_word(self, original_word: str, word: str, entries: List[MorphEntry],
+                     interactive: bool) -> List[MorphEntry]:
+        """Resolve a word's parsed entries, or try the last fallback if it has none."""
+        if entries:
+            return self._resolve_entries(word, entries, interactive)
         
         # Fallback 4: Try parsing root word without prefixes (if we have an expanded form)
         if word != original_word and word.startswith('ἐξ'):
@@ -157,26 +123,12 @@ class TextProcessor:
             root_entries = self.morph_parser.parse_word(root_word)
             
             if root_entries:
-                # Always collapse redundant entries regardless of interactive mode
-                root_entries = self._collapse_redundant_entries(root_entries)
-                if len(root_entries) > 1 and interactive:
-                    # Check if there are still multiple unique options after collapsing
-                    unique_entries = {}
-                    for entry in root_entries:
-                        base_lemma = re.sub(r'\d+$', '', entry.lemma)
-                        key = (base_lemma, entry.short_definition or "(no definition)")
-                        if key not in unique_entries:
-                            unique_entries[key] = entry
-                    
-                    if len(unique_entries) > 1:
-                        root_entries = self._disambiguate_entries(word, root_entries)
+                root_entries = self._resolve_entries(word, root_entries, interactive)
                 
                 # We found entries for the root word, create entries for the prefix + root
-                for entry in root_entries:
-                    # Create a new entry with the lemma prefixed with ἐξ
-                    if not entry.lemma.startswith('ἐξ'):
-                        entry.lemma = 'ἐξ' + entry.lemma
-                return root_entries
+                # (as copies, since the parser may hand the same entries out again)
+                return [entry if entry.lemma.startswith('ἐξ') else replace(entry, lemma='ἐξ' + entry.lemma)
+                        for entry in root_entries]
 
         # If all parsing attempts failed
         if word and word[0].isupper() and word.isalpha():
@@ -187,28 +139,45 @@ class TextProcessor:
             print(f"Warning: Could not parse word '{word}'")
         return []
         
+    def _resolve_entries(self, word: str, entries: List[MorphEntry], interactive: bool) -> List[MorphEntry]:
+        """Collapse redundant entries, then ask the user to choose if distinct ones remain."""
+        # Always collapse redundant entries regardless of interactive mode
+        entries = self._collapse_redundant_entries(entries)
+        if len(entries) > 1 and interactive:
+            # Check if there are still multiple unique options after collapsing
+            unique_entries = {}
+            for entry in entries:
+                base_lemma = _base_lemma(entry.lemma)
+                key = (base_lemma, entry.short_definition or "(no definition)")
+                if key not in unique_entries:
+                    unique_entries[key] = entry
+            
+            if len(unique_entries) > 1:
+                entries = self._disambiguate_entries(word, entries)
+        return entries
+        
     def _disambiguate_entries(self, word: str, entries: List[MorphEntry]) -> List[MorphEntry]:
         """Ask user to disambiguate multiple possible parses."""
         # First, collapse truly redundant entries (same base lemma, definition, features, and morph classes)
         collapsed_entries = self._collapse_redundant_entries(entries)
         
-        # Group entries by base lemma and definition to avoid duplicates in display
-        unique_entries = {}
+        # Group entries by base lemma and definition to avoid duplicates in display; the
+        # groups are kept so a choice maps straight back to its entries
+        display_groups = defaultdict(list)
         for entry in collapsed_entries:
             # Strip trailing numbers from lemma for grouping
-            base_lemma = re.sub(r'\d+$', '', entry.lemma)
-            key = (base_lemma, entry.short_definition or "(no definition)")
-            if key not in unique_entries:
-                unique_entries[key] = entry
+            key = (_base_lemma(entry.lemma), entry.short_definition or "(no definition)")
+            display_groups[key].append(entry)
         
         # If after grouping we only have one entry, return the collapsed entries
-        if len(unique_entries) == 1:
+        if len(display_groups) == 1:
             return collapsed_entries
             
         print(f"\nMultiple possibilities for '{word}':")
-        display_entries = list(unique_entries.values())
+        display_keys = list(display_groups)
+        display_entries = [group[0] for group in display_groups.values()]
         for i, entry in enumerate(display_entries, 1):
-            base_lemma = re.sub(r'\d+$', '', entry.lemma)
+            base_lemma = _base_lemma(entry.lemma)
             print(f"{i}. {base_lemma}: {entry.short_definition or '(no definition)'}")
         
         while True:
@@ -225,45 +194,39 @@ class TextProcessor:
                         # Use the specific entry from display_entries, not just base lemma matching
                         selected_entry = display_entries[idx]
                         # Find all entries from collapsed list that match both base lemma AND definition
-                        selected_base_lemma = re.sub(r'\d+$', '', selected_entry.lemma)
                         selected_definition = selected_entry.short_definition
                         
-                        matching_entries = [e for e in collapsed_entries 
-                                          if (re.sub(r'\d+$', '', e.lemma) == selected_base_lemma and 
-                                              e.short_definition == selected_definition)]
+                        matching_entries = [e for e in display_groups[display_keys[idx]]
+                                            if e.short_definition == selected_definition]
                         selected_entries.extend(matching_entries)
                 
                 return selected_entries
             except (ValueError, IndexError):
                 print("Invalid input. Please try again.")
                 
-    def _collapse_redundant_entries(self, entries: List[MorphEntry]) -> List[MorphEntry]:
-        """Collapse entries that are truly redundant (same base lemma and definition)."""
-        # Group entries by their "signature" - base lemma, definition, and part of speech
-        groups = {}
+    def _index_entries(self, entries: List[MorphEntry]) -> Dict[tuple, List[MorphEntry]]:
+        """Group entries in one pass by base lemma, definition, and part of speech."""
+        groups = defaultdict(list)
         for entry in entries:
-            base_lemma = re.sub(r'\d+$', '', entry.lemma)
-            # Create a signature based on base lemma, definition, and part of speech only
             # We don't include features and morph_classes because those represent different
             # inflected forms of the same lexical entry, not different words
             signature = (
-                base_lemma,
+                _base_lemma(entry.lemma),
                 entry.short_definition or "",
                 entry.part_of_speech
             )
-            if signature not in groups:
-                groups[signature] = []
             groups[signature].append(entry)
-        
+        return groups
+
+    def _collapse_redundant_entries(self, entries: List[MorphEntry]) -> List[MorphEntry]:
+        """Collapse entries that are truly redundant (same base lemma and definition)."""
         # For each group, keep only one representative entry (prefer the one without numbers)
         collapsed = []
-        for signature, group_entries in groups.items():
-            # Sort by lemma to prefer entries without numbers, then by lemma
-            sorted_entries = sorted(group_entries, key=lambda e: (re.search(r'\d+$', e.lemma) is not None, e.lemma))
-            representative = sorted_entries[0]
+        for group_entries in self._index_entries(entries).values():
+            # Prefer entries without numbers, then the first lemma alphabetically
+            representative = min(group_entries, key=lambda e: (e.lemma != _base_lemma(e.lemma), e.lemma))
             # Strip the number from the representative's lemma for cleaner display
-            representative.lemma = re.sub(r'\d+$', '', representative.lemma)
-            collapsed.append(representative)
+            # (on a copy, since the parser may hand the same entry out again)
+            collapsed.append(replace(representative, lemma=_base_lemma(representative.lemma)))
         
         return collapsed
- 
\ No newline at end of file
@@ -1,14 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import unicodedata
 
-@dataclass(frozen=True)  # Making the dataclass immutable ensures proper hash behavior
+@dataclass(frozen=True, slots=True)  # Immutable for proper hash behavior; slotted to keep long vocab lists small
 class VocabEntry:
     """A single vocabulary entry with lemma, definition, and morphological information."""
     lemma: str
     definition: str
     part_of_speech: str
     morphology: Optional[str] = None
+    # Both output formats start with the headword, so it is built once per entry
+    _headword: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_headword', self._get_headword())
     
     def __lt__(self, other):
         """Enable sorting by lemma with proper Greek character handling."""
@@ -72,8 +77,8 @@ class VocabEntry:
     
     def format_entry(self) -> str:
         """Format the entry for display in a vocabulary list."""
-        return f"{self._get_headword()}: {self._get_definition()}"
+        return f"{self._headword}: {self._get_definition()}"
     
     def format_latex_entry(self) -> str:
         """Format the entry for LaTeX output."""
-        return f"\\vocabentry{{{self._get_headword()}}}{{{self._get_definition()}}}" 
\ No newline at end of file
+        return f"\\vocabentry{{{self._headword}}}{{{self._get_definition()}}}" 
\ No newline at end of file
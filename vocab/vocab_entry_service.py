@@ -7,6 +7,62 @@ from morph.morph_class import MorphClass
 from morph.part_of_speech import PartOfSpeech
 
 
+# Greek accent marks: acute (΄), grave (`), circumflex (῀), on precomposed vowels
+_ACCENTED_VOWELS = frozenset('άέήίόύώὰὲὴὶὸὺὼᾶῆῖῦῶᾷῇῷ')
+
+# One vowel or diphthong; alternation order makes diphthongs win, as in a left-to-right scan
+_VOWEL_UNIT = re.compile(r'αι|ει|οι|υι|αυ|ευ|ου|ηυ|[αεηιουωάέήίόύώὰὲὴὶὸὺὼᾶῆῖῦῶᾷῇῷ]')
+
+def _os_h_on_endings(lemma: str, final_accented: bool) -> str:
+    """Feminine and neuter endings for -ος, -η, -ον adjectives."""
+    # Check if the letter before -ος is ε, ι, or ρ (alpha feminine rule)
+    if len(lemma) >= 2 and lemma[-2] in "ειρ":
+        return "ά, όν" if final_accented else "α, ον"  # Always alpha after ε, ι, ρ
+    return "ή, όν" if final_accented else "η, ον"  # Apply accentuation rule
+
+def _on_ending(lemma: str, final_accented: bool) -> str:
+    """Neuter ending for two-ending adjectives: apply accentuation rule."""
+    return "όν" if final_accented else "ον"
+
+# Endings for the adjective morph classes that determine them, in order of precedence
+# for entries with more than one of these classes
+_ADJECTIVE_ENDING_FORMATTERS = (
+    (MorphClass.ADJ_2_1_2, _os_h_on_endings),
+    (MorphClass.ADJ_2_2, _on_ending),
+    (MorphClass.ADJ_3_3, lambda lemma, final_accented: "ές"),  # Third declension adjectives typically keep their pattern
+    (MorphClass.US_EIA_U, lambda lemma, final_accented: "εῖα, ύ"),  # These patterns typically maintain their accents
+    (MorphClass.AS_ASA_AN, lambda lemma, final_accented: "ασα, αν"),  # These are typically unaccented
+    (MorphClass.WN_ON, _on_ending),
+    (MorphClass.WN_ON_COMP, _on_ending),
+)
+_ADJECTIVE_ENDINGS_BY_CLASS = {morph_class: (rank, formatter)
+                               for rank, (morph_class, formatter) in enumerate(_ADJECTIVE_ENDING_FORMATTERS)}
+
+def _os_fallback_endings(lemma: str, final_accented: bool, features) -> str:
+    """Endings for an -ος adjective with no morph class that determines them."""
+    # Adjectives with three endings (masc, fem, neut)
+    if Feature.FEMININE in features:
+        # Check if the letter before -ος is ε, ι, or ρ (alpha feminine rule)
+        if len(lemma) >= 2 and lemma[-2] in "ειρ":
+            return "ά, όν" if final_accented else "α, ον"  # Always alpha after ε, ι, ρ
+        else:
+            return "ή, όν" if final_accented else "α, ον"  # Apply accentuation rule
+    # Adjectives with two endings (masc/fem, neut) - just show neuter
+    return "όν" if final_accented else "ον"  # Apply accentuation rule
+
+# Fallback endings keyed by the lemma's last two letters; every suffix is two letters long,
+# so one dict lookup on lemma[-2:] replaces a chain of endswith checks
+_FALLBACK_ENDING_FORMATTERS = {
+    "ος": _os_fallback_endings,
+    "ης": lambda lemma, final_accented, features: "ές",  # Third declension pattern
+    "υς": lambda lemma, final_accented, features: "εῖα, ύ",  # This pattern typically maintains accents
+    "ων": lambda lemma, final_accented, features: "όν" if final_accented else "ον",  # Apply accentuation rule
+}
+
+# Most distinct analyses create_vocab_entry keeps VocabEntries for; the oldest are dropped first
+_MAX_CACHED_ENTRIES = 4096
+
+
 class VocabEntryService:
     """Service for creating and formatting vocabulary entries from morphological data."""
     
@@ -31,10 +87,31 @@ class VocabEntryService:
         "ὅς": "ὅς, ἥ, ὅ"  # relative pronoun
     }
     
+    def __init__(self):
+        # VocabEntries keyed by everything in a MorphEntry but the inflected form, which no
+        # formatting rule looks at, so the many forms of one word in a text share one entry
+        self._vocab_entries: Dict[tuple, VocabEntry] = {}
+    
     def create_vocab_entry(self, morph_entry: MorphEntry) -> VocabEntry:
-        """Convert a MorphEntry to a VocabEntry."""
+        """Convert a MorphEntry to a VocabEntry.
+        
+        Both are immutable, so the VocabEntry made for an analysis is reused whenever the
+        same lemma, part of speech, features, morph classes and definition come up again.
+        """
+        key = (morph_entry.lemma, morph_entry.part_of_speech, morph_entry.features,
+               morph_entry.morph_classes, morph_entry.short_definition)
+        vocab_entry = self._vocab_entries.get(key)
+        if vocab_entry is None:
+            if len(self._vocab_entries) >= _MAX_CACHED_ENTRIES:
+                # Dicts keep insertion order, so the first key is the oldest
+                self._vocab_entries.pop(next(iter(self._vocab_entries)))
+            vocab_entry = self._vocab_entries[key] = self._build_vocab_entry(morph_entry)
+        return vocab_entry
+    
+    def _build_vocab_entry(self, morph_entry: MorphEntry) -> VocabEntry:
+        """Convert a MorphEntry to a VocabEntry, without the cache."""
         # Strip any trailing numbers from the lemma
-        lemma = re.sub(r'\d+$', '', morph_entry.lemma)
+        lemma = morph_entry.lemma.rstrip('0123456789')
         
         # Special case handling for certain words regardless of part of speech
         # This ensures they get the right format even if morphological analysis is incomplete
@@ -202,40 +279,10 @@ class VocabEntryService:
         Returns:
             True if the final syllable has an accent, False otherwise
         """
-        if not word:
-            return False
-            
-        # Greek accent marks: acute (΄), grave (`), circumflex (῀)
-        # Also check for combined characters with accents
-        accent_chars = set(['ά', 'έ', 'ή', 'ί', 'ό', 'ύ', 'ώ', 'ὰ', 'ὲ', 'ὴ', 'ὶ', 'ὸ', 'ὺ', 'ὼ', 
-                           'ᾶ', 'ῆ', 'ῖ', 'ῦ', 'ῶ', 'ᾷ', 'ῇ', 'ῷ'])
-        
-        # Find vowels in the word (including diphthongs)
-        vowels = []
-        i = 0
-        while i < len(word):
-            char = word[i]
-            # Check for diphthongs first
-            if i < len(word) - 1:
-                diphthong = word[i:i+2]
-                if diphthong in ['αι', 'ει', 'οι', 'υι', 'αυ', 'ευ', 'ου', 'ηυ']:
-                    # Check if either part of diphthong is accented
-                    has_accent = any(c in accent_chars for c in diphthong)
-                    vowels.append((diphthong, has_accent))
-                    i += 2
-                    continue
-            
-            # Single vowel
-            if char in 'αεηιουωάέήίόύώὰὲὴὶὸὺὼᾶῆῖῦῶᾷῇῷ':
-                has_accent = char in accent_chars
-                vowels.append((char, has_accent))
-            i += 1
-        
-        if not vowels:
-            return False
-            
-        # Check if the final vowel/syllable is accented
-        return vowels[-1][1]
+        # Vowels and diphthongs, left to right with diphthongs taking precedence; the
+        # diphthongs listed are unaccented, so only a final single vowel can be accented
+        vowels = _VOWEL_UNIT.findall(word)
+        return bool(vowels) and vowels[-1] in _ACCENTED_VOWELS
 
     def _format_adjective_morphology(self, entry: MorphEntry) -> str:
         """Format adjective morphology information."""
@@ -248,42 +295,18 @@ class VocabEntryService:
         # Check if final syllable is accented to determine fem/neut accent pattern
         final_accented = self._is_final_syllable_accented(lemma)
         
-        # Handle adjective patterns based on morphological classes
-        if MorphClass.ADJ_2_1_2 in entry.morph_classes:
-            # Check if the letter before -ος is ε, ι, or ρ (alpha feminine rule)
-            if len(lemma) >= 2 and lemma[-2] in "ειρ":
-                return "ά, όν" if final_accented else "α, ον"  # Always alpha after ε, ι, ρ
-            else:
-                return "ή, όν" if final_accented else "η, ον"  # Apply accentuation rule
-        elif MorphClass.ADJ_2_2 in entry.morph_classes:
-            return "όν" if final_accented else "ον"  # Two-ending adjective: apply accentuation rule
-        elif MorphClass.ADJ_3_3 in entry.morph_classes:
-            return "ές"  # Third declension adjectives typically keep their pattern
-        elif MorphClass.US_EIA_U in entry.morph_classes:
-            return "εῖα, ύ"  # These patterns typically maintain their accents
-        elif MorphClass.AS_ASA_AN in entry.morph_classes:
-            return "ασα, αν"  # These are typically unaccented
-        elif MorphClass.WN_ON in entry.morph_classes or MorphClass.WN_ON_COMP in entry.morph_classes:
-            return "όν" if final_accented else "ον"  # Apply accentuation rule
+        # Handle adjective patterns based on morphological classes, looking up each of the
+        # entry's (few) classes rather than testing every pattern in turn
+        formatters = [_ADJECTIVE_ENDINGS_BY_CLASS[morph_class] for morph_class in entry.morph_classes
+                      if morph_class in _ADJECTIVE_ENDINGS_BY_CLASS]
+        if formatters:
+            _, formatter = min(formatters, key=lambda ranked: ranked[0])
+            return formatter(lemma, final_accented)
         
         # Fallback to endings if morphological class doesn't provide format
-        elif lemma.endswith("ος"):
-            # Adjectives with three endings (masc, fem, neut)
-            if Feature.FEMININE in entry.features:
-                # Check if the letter before -ος is ε, ι, or ρ (alpha feminine rule)
-                if len(lemma) >= 2 and lemma[-2] in "ειρ":
-                    return "ά, όν" if final_accented else "α, ον"  # Always alpha after ε, ι, ρ
-                else:
-                    return "ή, όν" if final_accented else "α, ον"  # Apply accentuation rule
-            # Adjectives with two endings (masc/fem, neut) - just show neuter
-            else:
-                return "όν" if final_accented else "ον"  # Apply accentuation rule
-        elif lemma.endswith("ης"):
-            return "ές"  # Third declension pattern
-        elif lemma.endswith("υς"):
-            return "εῖα, ύ"  # This pattern typically maintains accents
-        elif lemma.endswith("ων"):
-            return "όν" if final_accented else "ον"  # Apply accentuation rule
+        fallback = _FALLBACK_ENDING_FORMATTERS.get(lemma[-2:])
+        if fallback is not None:
+            return fallback(lemma, final_accented, entry.features)
         
         # Default format for other adjectives
         return None 
\ No newline at end of file
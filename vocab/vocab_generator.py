@@ -15,11 +15,11 @@ class VocabGenerator:
         # Extract unique words
         words = self.text_processor.extract_words(text)
         
-        # Process each word and create vocab entries
+        # Process all the words together, so cruncher runs once per parsing attempt for the
+        # whole text rather than once per word, and create vocab entries
         # Use a dictionary to track unique lemmas
         vocab_dict: Dict[str, VocabEntry] = {}
-        for word in words:
-            morph_entries = self.text_processor.process_word(word, interactive)
+        for morph_entries in self.text_processor.process_words(words, interactive).values():
             for entry in morph_entries:
                 # Skip if the lemma is in stop words
                 if entry.lemma in self.stop_words: